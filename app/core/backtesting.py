@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
-import pandas as pd
+import numpy as np
+
+from .prices import price_columns
 
 
 @dataclass(slots=True)
@@ -14,48 +16,73 @@ class BacktestResult:
     max_drawdown: float
 
 
-def _prepare_series(price_payload: Dict[str, object]) -> pd.Series:
-    candles = price_payload.get("candles")
-    if not candles:
-        raise ValueError("Price payload missing 'candles' data")
-    df = pd.DataFrame(candles)
-    if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date")
-        df = df.set_index("date")
-    return df["close"].astype(float)
+def _prepare_series(price_payload: Dict[str, object]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return date-sorted closes (float64) and their dates (datetime64[D])."""
+
+    try:
+        raw_dates, raw_closes = price_columns(price_payload)
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Malformed price candles: {exc}") from exc
+    if not raw_closes:
+        raise ValueError("Price payload missing close data")
+    if len(raw_dates) != len(raw_closes):
+        raise ValueError("Price payload dates and closes differ in length")
+    try:
+        closes = np.fromiter(raw_closes, dtype=np.float64, count=len(raw_closes))
+        dates = np.array(raw_dates, dtype="datetime64[D]")
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Malformed price data: {exc}") from exc
+    if dates.size > 1 and (dates[1:] < dates[:-1]).any():
+        order = np.argsort(dates, kind="stable")
+        closes = closes[order]
+        dates = dates[order]
+    return closes, dates
 
 
-def _calculate_cagr(series: pd.Series) -> float:
-    if series.empty:
-        return 0.0
-    start_value = series.iloc[0]
-    end_value = series.iloc[-1]
-    years = max((series.index[-1] - series.index[0]).days / 365.25, 1 / 12)
-    return (end_value / start_value) ** (1 / years) - 1
+def _day_span(dates: np.ndarray) -> int:
+    if dates.size == 0:
+        return 0
+    return int((dates[-1] - dates[0]).astype("int64"))
 
 
-def _calculate_max_drawdown(series: pd.Series) -> float:
-    if series.empty:
-        return 0.0
-    running_max = series.cummax()
-    drawdowns = (series / running_max) - 1
-    return float(drawdowns.min())
+def _backtest_kernel(closes: np.ndarray, day_span: int) -> Tuple[float, float, float]:
+    """Cumulative return, CAGR, and max drawdown for a date-sorted close array."""
+
+    if closes.size == 0:
+        return 0.0, 0.0, 0.0
+    growth = closes[-1] / closes[0]
+    cumulative_return = float(growth - 1) if closes.size > 1 else 0.0
+    years = max(day_span / 365.25, 1 / 12)
+    cagr = float(growth ** (1 / years) - 1)
+    # Reuse the running-max buffer for the close/peak ratios so the drawdown pass
+    # allocates a single temporary instead of three.
+    scratch = np.maximum.accumulate(closes)
+    np.divide(closes, scratch, out=scratch)
+    max_drawdown = float(scratch.min() - 1)
+    return cumulative_return, cagr, max_drawdown
 
 
 def run_backtest(ticker: str, price_payload: Dict[str, object]) -> BacktestResult:
-    series = _prepare_series(price_payload)
-    cumulative_return = float(series.iloc[-1] / series.iloc[0] - 1) if len(series) > 1 else 0.0
-    cagr = float(_calculate_cagr(series))
-    max_drawdown = float(_calculate_max_drawdown(series))
-    return BacktestResult(ticker=ticker, cumulative_return=cumulative_return, cagr=cagr, max_drawdown=max_drawdown)
+    closes, dates = _prepare_series(price_payload)
+    return _run_prepared((ticker, closes, _day_span(dates)))
 
 
 def run_backtests(price_payloads: Dict[str, Dict[str, object]]) -> List[BacktestResult]:
-    results: List[BacktestResult] = []
+    # Convert every payload up-front so the numeric pass runs over plain arrays only.
+    prepared: List[Tuple[str, np.ndarray, int]] = []
     for ticker, payload in price_payloads.items():
         try:
-            results.append(run_backtest(ticker, payload))
+            closes, dates = _prepare_series(payload)
         except ValueError:
             continue
-    return results
+        prepared.append((ticker, closes, _day_span(dates)))
+
+    # Serial on purpose: each series is only a few hundred closes, so Python dispatch
+    # dominates the kernel and a thread pool measured slower than this loop.
+    return [_run_prepared(item) for item in prepared]
+
+
+def _run_prepared(item: Tuple[str, np.ndarray, int]) -> BacktestResult:
+    ticker, closes, day_span = item
+    cumulative_return, cagr, max_drawdown = _backtest_kernel(closes, day_span)
+    return BacktestResult(ticker=ticker, cumulative_return=cumulative_return, cagr=cagr, max_drawdown=max_drawdown)
@@ -0,0 +1,48 @@
+"""JSON encode/decode helpers backed by orjson when it is installed."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+__all__ = ["JSONDecodeError", "dumps", "loads", "write_atomic"]
+
+# orjson.JSONDecodeError subclasses the stdlib error, so callers can catch a single type.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(payload: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``payload`` to UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        # NumPy scalars are float/int subclasses that stdlib json accepts; keep parity.
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option)
+    return json.dumps(payload, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` via a sibling temp file and ``os.replace`` so readers never see a torn file."""
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
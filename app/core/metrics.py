@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import Dict, Optional, Type
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
 
 
 @dataclass(slots=True)
@@ -58,6 +59,18 @@ class RiskMetrics:
     drawdown_1y: float
 
 
+# Field names resolved once so serialization avoids dataclasses.asdict's recursive copy.
+_GROWTH_FIELDS = tuple(item.name for item in fields(GrowthMetrics))
+_QUALITY_FIELDS = tuple(item.name for item in fields(QualityMetrics))
+_CATALYST_FIELDS = tuple(item.name for item in fields(CatalystMetrics))
+_VALUATION_FIELDS = tuple(item.name for item in fields(ValuationMetrics))
+_RISK_FIELDS = tuple(item.name for item in fields(RiskMetrics))
+
+
+def _metrics_to_dict(metrics: object, names: Tuple[str, ...]) -> Dict[str, object]:
+    return {name: getattr(metrics, name) for name in names}
+
+
 @dataclass(slots=True)
 class CompanyIndicators:
     """Full set of indicators used by the scoring engine."""
@@ -76,10 +89,20 @@ class CompanyIndicators:
     def to_dict(self) -> Dict[str, object]:
         """Serialize indicators so they can be cached on disk."""
 
-        payload = asdict(self)
+        payload: Dict[str, object] = {
+            "ticker": self.ticker,
+            "name": self.name,
+            "growth": _metrics_to_dict(self.growth, _GROWTH_FIELDS),
+            "quality": _metrics_to_dict(self.quality, _QUALITY_FIELDS),
+            "catalysts": _metrics_to_dict(self.catalysts, _CATALYST_FIELDS),
+            "valuation": _metrics_to_dict(self.valuation, _VALUATION_FIELDS),
+            "risk": _metrics_to_dict(self.risk, _RISK_FIELDS),
+            "sector": self.sector,
+            "industry": self.industry,
+        }
         # Drop empty metadata containers to keep caches compact.
-        if not payload.get("metadata"):
-            payload.pop("metadata", None)
+        if self.metadata:
+            payload["metadata"] = dict(self.metadata)
         return payload
 
     @classmethod
@@ -101,7 +124,7 @@ class CompanyIndicators:
         )
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class WeightConfig:
     """Configurable factor weights for composite scoring."""
 
@@ -115,47 +138,62 @@ class WeightConfig:
         return self.growth + self.quality + self.catalysts + self.valuation + self.risk
 
     def normalized(self) -> "WeightConfig":
-        total = self.total_weight()
-        if total <= 0:
-            # Fallback to evenly distributed weights when the user zeroes everything.
-            equal_weight = 1 / 5
-            return WeightConfig(
-                growth=equal_weight,
-                quality=equal_weight,
-                catalysts=equal_weight,
-                valuation=equal_weight,
-                risk=equal_weight,
-            )
-        scale = 1 / total
+        growth, quality, catalysts, valuation, risk = self._norm_tuple()
         return WeightConfig(
-            growth=self.growth * scale,
-            quality=self.quality * scale,
-            catalysts=self.catalysts * scale,
-            valuation=self.valuation * scale,
-            risk=self.risk * scale,
+            growth=growth,
+            quality=quality,
+            catalysts=catalysts,
+            valuation=valuation,
+            risk=risk,
         )
 
+    def _norm_tuple(self) -> Tuple[float, float, float, float, float]:
+        """Normalized weights in factor order, memoized per (hashable) config."""
+
+        return _normalized_weights(self)
+
     def to_dict(self) -> Dict[str, float]:
-        normalized = self.normalized()
+        growth, quality, catalysts, valuation, risk = self._norm_tuple()
         return {
-            "growth": normalized.growth,
-            "quality": normalized.quality,
-            "catalysts": normalized.catalysts,
-            "valuation": normalized.valuation,
-            "risk": normalized.risk,
+            "growth": growth,
+            "quality": quality,
+            "catalysts": catalysts,
+            "valuation": valuation,
+            "risk": risk,
         }
 
     @classmethod
     def from_dict(cls: Type["WeightConfig"], payload: Dict[str, float]) -> "WeightConfig":
         return cls(
-            growth=float(payload.get("growth", cls().growth)),
-            quality=float(payload.get("quality", cls().quality)),
-            catalysts=float(payload.get("catalysts", cls().catalysts)),
-            valuation=float(payload.get("valuation", cls().valuation)),
-            risk=float(payload.get("risk", cls().risk)),
+            growth=float(payload.get("growth", _DEFAULT_WEIGHTS.growth)),
+            quality=float(payload.get("quality", _DEFAULT_WEIGHTS.quality)),
+            catalysts=float(payload.get("catalysts", _DEFAULT_WEIGHTS.catalysts)),
+            valuation=float(payload.get("valuation", _DEFAULT_WEIGHTS.valuation)),
+            risk=float(payload.get("risk", _DEFAULT_WEIGHTS.risk)),
         )
 
 
+# Shared fallback so defaults are not rebuilt on every from_dict/composite call.
+_DEFAULT_WEIGHTS = WeightConfig()
+
+
+@lru_cache(maxsize=64)
+def _normalized_weights(config: WeightConfig) -> Tuple[float, float, float, float, float]:
+    total = config.total_weight()
+    if total <= 0:
+        # Fallback to evenly distributed weights when the user zeroes everything.
+        equal_weight = 1 / 5
+        return equal_weight, equal_weight, equal_weight, equal_weight, equal_weight
+    scale = 1 / total
+    return (
+        config.growth * scale,
+        config.quality * scale,
+        config.catalysts * scale,
+        config.valuation * scale,
+        config.risk * scale,
+    )
+
+
 @dataclass(slots=True)
 class ScoreBreakdown:
     ticker: str
@@ -171,13 +209,13 @@ class ScoreBreakdown:
     def composite(self) -> float:
         """Weighted composite score."""
 
-        weights = (self.weights or WeightConfig()).normalized().to_dict()
+        growth, quality, catalysts, valuation, risk = (self.weights or _DEFAULT_WEIGHTS)._norm_tuple()
         return (
-            self.growth * weights["growth"]
-            + self.quality * weights["quality"]
-            + self.catalysts * weights["catalysts"]
-            + self.valuation * weights["valuation"]
-            + self.risk * weights["risk"]
+            self.growth * growth
+            + self.quality * quality
+            + self.catalysts * catalysts
+            + self.valuation * valuation
+            + self.risk * risk
         )
 
     def to_dict(self) -> Dict[str, float]:
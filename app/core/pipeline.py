@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from typing import TYPE_CHECKING
 
@@ -12,6 +13,9 @@ from .transformers import IndicatorTransformer, MetricSource
 if TYPE_CHECKING:
     from app.data.ingestion import ProviderHealthMonitor
 
+# Provider calls are network-bound, so a modest pool overlaps latency without tripping rate limits.
+_MAX_FETCH_WORKERS = 8
+
 
 @dataclass(slots=True)
 class PipelineConfig:
@@ -29,6 +33,32 @@ class IndicatorPipeline:
         provider = self.config.providers["primary"]
         fundamentals = provider.fundamentals(ticker)
         metadata = self._aggregate_metadata(ticker)
+        return self._transform(ticker, fundamentals, metadata, name=name)
+
+    def build_many(self, tickers: Iterable[str]) -> List[CompanyIndicators]:
+        """Fetch primary and theme data for all tickers concurrently, then transform serially."""
+
+        tickers = list(tickers)
+        if not tickers:
+            return []
+        provider = self.config.providers["primary"]
+        with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(tickers))) as executor:
+            metadata_results = executor.map(self._aggregate_metadata, tickers)
+            fundamentals_list = list(executor.map(provider.fundamentals, tickers))
+            metadata_list = list(metadata_results)
+        return [
+            self._transform(ticker, fundamentals, metadata)
+            for ticker, fundamentals, metadata in zip(tickers, fundamentals_list, metadata_list)
+        ]
+
+    @staticmethod
+    def _transform(
+        ticker: str,
+        fundamentals: Dict[str, Any],
+        metadata: Dict[str, float],
+        *,
+        name: Optional[str] = None,
+    ) -> CompanyIndicators:
         transformer = IndicatorTransformer(ticker=ticker, name=name)
         return transformer.build(
             MetricSource(
@@ -37,9 +67,6 @@ class IndicatorPipeline:
             )
         )
 
-    def build_many(self, tickers: Iterable[str]) -> List[CompanyIndicators]:
-        return [self.build_company(ticker) for ticker in tickers]
-
     def _aggregate_metadata(self, ticker: str) -> Dict[str, float]:
         """Combine auxiliary signals that may live outside the primary provider."""
 
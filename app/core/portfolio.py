@@ -4,9 +4,13 @@ from dataclasses import dataclass
 from typing import Dict, Iterable, List
 
 import numpy as np
+import pandas as pd
 
 from .metrics import CompanyIndicators, ScoreBreakdown
 
+# Lower-tail 5% quantile of the standard normal, used for the parametric VaR.
+_NORMAL_Q05 = -1.6448536269514722
+
 
 @dataclass(slots=True)
 class PositionSuggestion:
@@ -36,15 +40,23 @@ class StressScenarioResult:
     notes: List[str]
 
 
-def _raw_weight(score: ScoreBreakdown, indicators: CompanyIndicators) -> float:
-    risk = indicators.risk
-    liquidity_penalty = 1.0
-    if risk.avg_daily_dollar_volume < 1e7:
-        liquidity_penalty *= 0.7
-    if risk.market_cap < 1e9:
-        liquidity_penalty *= 0.5
-    volatility_penalty = max(risk.volatility_3y, 0.15)
-    return max(score.composite, 0.0) * liquidity_penalty / volatility_penalty
+def _raw_weights(scored: List[tuple[ScoreBreakdown, CompanyIndicators]]) -> np.ndarray:
+    columns = np.array(
+        [
+            (
+                score.composite,
+                data.risk.avg_daily_dollar_volume,
+                data.risk.market_cap,
+                data.risk.volatility_3y,
+            )
+            for score, data in scored
+        ],
+        dtype=np.float64,
+    )
+    composite, dollar_volume, market_cap, volatility = columns.T
+    liquidity_penalty = np.where(dollar_volume < 1e7, 0.7, 1.0) * np.where(market_cap < 1e9, 0.5, 1.0)
+    volatility_penalty = np.maximum(volatility, 0.15)
+    return np.maximum(composite, 0.0) * liquidity_penalty / volatility_penalty
 
 
 def build_portfolio_plan(
@@ -62,19 +74,22 @@ def build_portfolio_plan(
             scenarios=[],
         )
 
-    raw_weights = [max(_raw_weight(score, data), 0.0) for score, data in scored]
-    total = sum(raw_weights)
+    raw_weights = _raw_weights(scored)
+    total = float(raw_weights.sum())
     if total <= 0:
-        total = len(raw_weights)
-        raw_weights = [1.0 for _ in raw_weights]
+        raw_weights = np.ones_like(raw_weights)
+        total = float(raw_weights.size)
 
-    normalized_weights = [weight / total for weight in raw_weights]
+    weights_arr = raw_weights / total
+
+    factor_returns = np.array([score.growth + score.catalysts for score, _ in scored], dtype=np.float64)
+    volatilities = np.array([data.risk.volatility_3y for _, data in scored], dtype=np.float64)
+    expected_return = float(weights_arr @ factor_returns)
+    volatility_proxy = float(weights_arr @ volatilities)
 
     suggestions: List[PositionSuggestion] = []
-    expected_return = 0.0
-    volatility_proxy = 0.0
-    sector_totals: Dict[str, float] = {}
-    for (score, data), weight in zip(scored, normalized_weights):
+    sector_names: List[str] = []
+    for (score, data), weight in zip(scored, weights_arr.tolist()):
         notes: List[str] = []
         if data.risk.avg_daily_dollar_volume < 2e7:
             notes.append("Thin liquidity — size carefully")
@@ -86,7 +101,7 @@ def build_portfolio_plan(
         sector_name = data.sector or data.metadata.get("sector") if data.metadata else None
         if not sector_name:
             sector_name = "Unclassified"
-        sector_totals[sector_name] = sector_totals.get(sector_name, 0.0) + weight
+        sector_names.append(sector_name)
 
         suggestions.append(
             PositionSuggestion(
@@ -97,12 +112,15 @@ def build_portfolio_plan(
                 notes=notes,
             )
         )
-        expected_return += weight * (score.growth + score.catalysts)
-        volatility_proxy += weight * data.risk.volatility_3y
 
-    diversification_index = 1 - float(sum(weight ** 2 for weight in normalized_weights))
+    # factorize keeps first-seen order, so allocations list sectors as positions introduce them.
+    sector_codes, sectors = pd.factorize(np.asarray(sector_names, dtype=object))
+    sector_weights = np.bincount(sector_codes, weights=weights_arr, minlength=len(sectors))
+    sector_totals: Dict[str, float] = dict(zip(sectors.tolist(), sector_weights.tolist()))
+
+    diversification_index = 1 - float(weights_arr @ weights_arr)
 
-    scenarios = _simulate_scenarios(scored, normalized_weights)
+    scenarios = _simulate_scenarios(scored, weights_arr)
 
     return PortfolioPlan(
         suggestions=suggestions,
@@ -115,25 +133,24 @@ def build_portfolio_plan(
 
 
 def _simulate_scenarios(
-    scored: List[tuple[ScoreBreakdown, CompanyIndicators]], weights: List[float]
+    scored: List[tuple[ScoreBreakdown, CompanyIndicators]], weights_arr: np.ndarray
 ) -> List[StressScenarioResult]:
     if not scored:
         return []
-    rng = np.random.default_rng(42)
-    weights_arr = np.array(weights)
     factor_returns = np.array([max(score.growth + score.catalysts, 0.0) for score, _ in scored])
     volatilities = np.array([max(data.risk.volatility_3y, 0.05) for _, data in scored])
+    # Scenario shifts are scalars, so the base moments can be shared across every scenario.
+    base_expected = float(weights_arr @ factor_returns)
+    base_variance = float((weights_arr ** 2) @ (volatilities ** 2))
 
     scenarios: List[StressScenarioResult] = []
 
     def run(label: str, return_shift: float, vol_multiplier: float, notes: List[str]) -> StressScenarioResult:
-        mean = factor_returns * return_shift
-        sigma = volatilities * vol_multiplier
-        draws = rng.normal(loc=mean, scale=sigma, size=(2000, len(scored)))
-        portfolio_paths = draws @ weights_arr
-        expected = float(np.mean(portfolio_paths))
-        volatility = float(np.std(portfolio_paths))
-        var = float(np.percentile(portfolio_paths, 5))
+        # Positions are modelled as independent normals, so the portfolio moments and
+        # its 5% quantile have closed forms; no sampling required.
+        expected = base_expected * return_shift
+        volatility = float(np.sqrt(base_variance)) * vol_multiplier
+        var = expected + _NORMAL_Q05 * volatility
         return StressScenarioResult(
             name=label,
             expected_return=expected,
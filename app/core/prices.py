@@ -0,0 +1,52 @@
+"""Accessors for price-history payloads.
+
+Payloads are stored column-wise as ``{"dates": [...], "closes": [...]}``. Older cache
+files (and the sample provider) use a list of ``{"date", "close"}`` candles, so every
+accessor here accepts both layouts.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def price_columns(payload: Dict[str, Any]) -> Tuple[Sequence[Any], Sequence[Any]]:
+    """Return ``(dates, closes)`` from a columnar or legacy ``candles`` payload.
+
+    Raises ``KeyError``/``TypeError`` when legacy candles are malformed.
+    """
+
+    if "closes" in payload:
+        return payload.get("dates") or [], payload.get("closes") or []
+    candles = payload.get("candles") or []
+    return [candle["date"] for candle in candles], [candle["close"] for candle in candles]
+
+
+def to_columnar(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a legacy ``candles`` payload to the columnar layout (no-op otherwise)."""
+
+    if "candles" not in payload:
+        return payload
+    dates, closes = price_columns(payload)
+    columnar = {key: value for key, value in payload.items() if key != "candles"}
+    columnar["dates"] = list(dates)
+    columnar["closes"] = [float(close) for close in closes]
+    return columnar
+
+
+def latest_close(payload: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Most recent close in ``payload``, or ``None`` when absent or malformed."""
+
+    if not isinstance(payload, dict):
+        return None
+    closes: Optional[List[Any]] = payload.get("closes")
+    try:
+        if closes is None:
+            candles = payload.get("candles")
+            if not candles:
+                return None
+            return float(candles[-1].get("close"))
+        if not closes:
+            return None
+        return float(closes[-1])
+    except (TypeError, ValueError, AttributeError):
+        return None
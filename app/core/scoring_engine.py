@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from typing import Iterable, List, Optional
 
+import numpy as np
+
 from .metrics import CompanyIndicators, ScoreBreakdown, WeightConfig
-from app.scoring.growth import score_growth
-from app.scoring.quality import score_quality
-from app.scoring.catalysts import score_catalysts
-from app.scoring.valuation import score_valuation
-from app.scoring.risk import score_risk
+from app.scoring.growth import score_growth, score_growth_batch
+from app.scoring.quality import score_quality, score_quality_batch
+from app.scoring.catalysts import score_catalysts, score_catalysts_batch
+from app.scoring.valuation import score_valuation, score_valuation_batch
+from app.scoring.risk import score_risk, score_risk_batch
 
 
 def evaluate_company(
@@ -32,5 +34,41 @@ def rank_companies(
 ) -> List[ScoreBreakdown]:
     """Evaluate and rank companies by composite score."""
 
-    scores = [evaluate_company(item, weight_config=weight_config) for item in indicators]
-    return sorted(scores, key=lambda item: item.composite, reverse=True)
+    companies = list(indicators)
+    if not companies:
+        return []
+
+    # One row per company, one column per factor, so the composite is a single matrix-vector product.
+    factor_scores = np.column_stack(
+        (
+            score_growth_batch([item.growth for item in companies]),
+            score_quality_batch([item.quality for item in companies]),
+            score_catalysts_batch([item.catalysts for item in companies]),
+            score_valuation_batch([item.valuation for item in companies]),
+            score_risk_batch([item.risk for item in companies]),
+        )
+    )
+    normalized = (weight_config or WeightConfig()).normalized()
+    weights = np.array(
+        [normalized.growth, normalized.quality, normalized.catalysts, normalized.valuation, normalized.risk]
+    )
+    composite = factor_scores @ weights
+    order = np.argsort(-composite, kind="stable")
+
+    ranked: List[ScoreBreakdown] = []
+    for index in order:
+        item = companies[index]
+        growth, quality, catalysts, valuation, risk = factor_scores[index].tolist()
+        ranked.append(
+            ScoreBreakdown(
+                ticker=item.ticker,
+                name=item.name,
+                growth=growth,
+                quality=quality,
+                catalysts=catalysts,
+                valuation=valuation,
+                risk=risk,
+                weights=weight_config,
+            )
+        )
+    return ranked
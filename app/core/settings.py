@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
+from . import jsonio
 from .metrics import WeightConfig
 
 
@@ -32,20 +32,53 @@ class UserPreferences:
         if not payload:
             return cls()
         return cls(
-            theme=str(payload.get("theme", cls().theme)),
+            theme=str(payload.get("theme", _DEFAULT_PREFERENCES.theme)),
             favorites=[str(item).upper() for item in payload.get("favorites", []) if str(item).strip()],
-            live_tickers=[str(item).upper() for item in payload.get("live_tickers", cls().live_tickers)],
-            data_mode=str(payload.get("data_mode", cls().data_mode)),
+            live_tickers=[
+                str(item).upper() for item in payload.get("live_tickers", _DEFAULT_PREFERENCES.live_tickers)
+            ],
+            data_mode=str(payload.get("data_mode", _DEFAULT_PREFERENCES.data_mode)),
             auto_refresh=bool(payload.get("auto_refresh", False)),
         )
 
 
-class WeightSettingsStore:
+# Read-only fallback values for from_dict; from_dict always copies the list fields.
+_DEFAULT_PREFERENCES = UserPreferences()
+
+
+class _JsonFileStore:
+    """Small JSON file with atomic writes and an in-process copy keyed on the file's stat."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._cached: Optional[Tuple[Tuple[int, int], Any]] = None
+
+    def _read_payload(self) -> Optional[Any]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._cached is not None and self._cached[0] == signature:
+            return self._cached[1]
+        try:
+            payload = jsonio.loads(self.path.read_bytes())
+        except (jsonio.JSONDecodeError, OSError):
+            return None
+        self._cached = (signature, payload)
+        return payload
+
+    def _write_payload(self, payload: Any) -> None:
+        jsonio.write_atomic(self.path, jsonio.dumps(payload, indent=True))
+        self._cached = None
+
+
+class WeightSettingsStore(_JsonFileStore):
     """Persist user-selected scoring weights on the local filesystem."""
 
     def __init__(self, path: Optional[Path] = None) -> None:
-        self.path = path or self._default_path()
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(path or self._default_path())
 
     @staticmethod
     def _default_path() -> Path:
@@ -53,25 +86,20 @@ class WeightSettingsStore:
         return app_root / "weights.json"
 
     def load(self) -> WeightConfig:
-        if not self.path.exists():
-            return WeightConfig()
-        try:
-            payload = json.loads(self.path.read_text())
-        except (json.JSONDecodeError, OSError):
+        payload = self._read_payload()
+        if payload is None:
             return WeightConfig()
         return WeightConfig.from_dict(payload)
 
     def save(self, config: WeightConfig) -> None:
-        normalized = config.normalized()
-        self.path.write_text(json.dumps(normalized.to_dict(), indent=2))
+        self._write_payload(config.to_dict())
 
 
-class UserPreferencesStore:
+class UserPreferencesStore(_JsonFileStore):
     """Persist UI preferences such as theme and favorite tickers."""
 
     def __init__(self, path: Optional[Path] = None) -> None:
-        self.path = path or self._default_path()
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(path or self._default_path())
 
     @staticmethod
     def _default_path() -> Path:
@@ -79,13 +107,10 @@ class UserPreferencesStore:
         return app_root / "preferences.json"
 
     def load(self) -> UserPreferences:
-        if not self.path.exists():
-            return UserPreferences()
-        try:
-            payload = json.loads(self.path.read_text())
-        except (json.JSONDecodeError, OSError):
+        payload = self._read_payload()
+        if payload is None:
             return UserPreferences()
         return UserPreferences.from_dict(payload)
 
     def save(self, preferences: UserPreferences) -> None:
-        self.path.write_text(json.dumps(preferences.to_dict(), indent=2))
+        self._write_payload(preferences.to_dict())
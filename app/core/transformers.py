@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .metrics import (
     CatalystMetrics,
@@ -22,6 +22,80 @@ class MetricSource:
     metadata: Optional[Dict[str, Any]] = None
 
 
+# field -> (source payload, key path, default) for each metric group.
+_FieldSpec = Tuple[str, Tuple[str, ...], Any]
+
+_GROWTH_SPEC: Dict[str, _FieldSpec] = {
+    "revenue_cagr_3y": ("fundamentals", ("growth", "threeYearRevenueCagr"), 0.0),
+    "revenue_acceleration": ("fundamentals", ("growth", "revenueGrowth"), 0.0),
+    "ebit_margin_trend": ("fundamentals", ("profitability", "ebitMargin"), 0.0),
+    "fcf_margin": ("fundamentals", ("profitability", "freeCashFlowMargin"), 0.0),
+    "backlog_growth": ("fundamentals", ("operational", "backlogGrowth"), None),
+}
+
+_QUALITY_SPEC: Dict[str, _FieldSpec] = {
+    "roic": ("fundamentals", ("profitability", "roic"), 0.0),
+    "roic_trend": ("fundamentals", ("trend", "roic"), 0.0),
+    "net_debt_to_ebitda": ("fundamentals", ("leverage", "netDebtToEbitda"), 3.0),
+    "interest_coverage": ("fundamentals", ("leverage", "interestCoverage"), 0.0),
+    "asset_turnover_trend": ("fundamentals", ("trend", "assetTurnover"), 0.0),
+}
+
+_CATALYST_SPEC: Dict[str, _FieldSpec] = {
+    "theme_alignment": ("meta", ("themeAlignment",), 0.0),
+    "earnings_revision_trend": ("fundamentals", ("sentiment", "earningsRevision"), 0.0),
+    "insider_activity_score": ("fundamentals", ("sentiment", "insiderActivity"), 0.0),
+    "strategic_investor_presence": ("meta", ("strategicInvestorScore",), None),
+}
+
+_VALUATION_SPEC: Dict[str, _FieldSpec] = {
+    "peg_ratio": ("fundamentals", ("valuation", "pegRatio"), 2.0),
+    "ev_to_ebitda_vs_peers": ("meta", ("evToEbitdaVsPeers",), 0.0),
+    "free_cash_flow_yield": ("fundamentals", ("valuation", "fcfYield"), 0.0),
+    "price_momentum": ("meta", ("priceMomentum",), 0.0),
+    "consolidation_score": ("meta", ("consolidationScore",), 0.0),
+}
+
+_RISK_SPEC: Dict[str, _FieldSpec] = {
+    "market_cap": ("fundamentals", ("size", "marketCap"), 0.0),
+    "avg_daily_dollar_volume": ("meta", ("avgDollarVolume",), 0.0),
+    "beta": ("fundamentals", ("risk", "beta"), 1.0),
+    "volatility_3y": ("fundamentals", ("risk", "volatility3Y"), 0.3),
+    "drawdown_1y": ("meta", ("drawdown1Y",), 0.2),
+}
+
+
+def _compile_builder(cls: type, spec: Dict[str, _FieldSpec]) -> Callable[[Dict[str, Any], Dict[str, Any]], Any]:
+    """Generate a straight-line ``(fundamentals, meta) -> cls`` constructor for ``spec``.
+
+    Each field becomes a direct subscript chain with a ``try``/``except`` fallback to its
+    default, matching ``IndicatorTransformer._safe_get`` without walking a key list per call.
+    """
+
+    lines = ["def build(fundamentals, meta):"]
+    namespace: Dict[str, Any] = {"cls": cls}
+    for index, (source, keys, default) in enumerate(spec.values()):
+        namespace[f"default_{index}"] = default
+        lookup = "".join(f"[{key!r}]" for key in keys)
+        lines += [
+            "    try:",
+            f"        value_{index} = {source}{lookup}",
+            "    except (KeyError, TypeError, IndexError):",
+            f"        value_{index} = default_{index}",
+        ]
+    arguments = ", ".join(f"{field}=value_{index}" for index, field in enumerate(spec))
+    lines.append(f"    return cls({arguments})")
+    exec("\n".join(lines), namespace)  # noqa: S102 - source is built from the static specs above
+    return namespace["build"]
+
+
+_build_growth = _compile_builder(GrowthMetrics, _GROWTH_SPEC)
+_build_quality = _compile_builder(QualityMetrics, _QUALITY_SPEC)
+_build_catalysts = _compile_builder(CatalystMetrics, _CATALYST_SPEC)
+_build_valuation = _compile_builder(ValuationMetrics, _VALUATION_SPEC)
+_build_risk = _compile_builder(RiskMetrics, _RISK_SPEC)
+
+
 class IndicatorTransformer:
     """Translate provider payloads into normalized indicator objects."""
 
@@ -33,44 +107,11 @@ class IndicatorTransformer:
         fundamentals = source.fundamentals
         meta = dict(source.metadata or {})
 
-        growth = GrowthMetrics(
-            revenue_cagr_3y=self._safe_get(fundamentals, ["growth", "threeYearRevenueCagr"], default=0.0),
-            revenue_acceleration=self._safe_get(fundamentals, ["growth", "revenueGrowth"], default=0.0),
-            ebit_margin_trend=self._safe_get(fundamentals, ["profitability", "ebitMargin"], default=0.0),
-            fcf_margin=self._safe_get(fundamentals, ["profitability", "freeCashFlowMargin"], default=0.0),
-            backlog_growth=self._safe_get(fundamentals, ["operational", "backlogGrowth"], default=None),
-        )
-
-        quality = QualityMetrics(
-            roic=self._safe_get(fundamentals, ["profitability", "roic"], default=0.0),
-            roic_trend=self._safe_get(fundamentals, ["trend", "roic"], default=0.0),
-            net_debt_to_ebitda=self._safe_get(fundamentals, ["leverage", "netDebtToEbitda"], default=3.0),
-            interest_coverage=self._safe_get(fundamentals, ["leverage", "interestCoverage"], default=0.0),
-            asset_turnover_trend=self._safe_get(fundamentals, ["trend", "assetTurnover"], default=0.0),
-        )
-
-        catalysts = CatalystMetrics(
-            theme_alignment=self._safe_get(meta, ["themeAlignment"], default=0.0),
-            earnings_revision_trend=self._safe_get(fundamentals, ["sentiment", "earningsRevision"], default=0.0),
-            insider_activity_score=self._safe_get(fundamentals, ["sentiment", "insiderActivity"], default=0.0),
-            strategic_investor_presence=self._safe_get(meta, ["strategicInvestorScore"], default=None),
-        )
-
-        valuation = ValuationMetrics(
-            peg_ratio=self._safe_get(fundamentals, ["valuation", "pegRatio"], default=2.0),
-            ev_to_ebitda_vs_peers=self._safe_get(meta, ["evToEbitdaVsPeers"], default=0.0),
-            free_cash_flow_yield=self._safe_get(fundamentals, ["valuation", "fcfYield"], default=0.0),
-            price_momentum=self._safe_get(meta, ["priceMomentum"], default=0.0),
-            consolidation_score=self._safe_get(meta, ["consolidationScore"], default=0.0),
-        )
-
-        risk = RiskMetrics(
-            market_cap=self._safe_get(fundamentals, ["size", "marketCap"], default=0.0),
-            avg_daily_dollar_volume=self._safe_get(meta, ["avgDollarVolume"], default=0.0),
-            beta=self._safe_get(fundamentals, ["risk", "beta"], default=1.0),
-            volatility_3y=self._safe_get(fundamentals, ["risk", "volatility3Y"], default=0.3),
-            drawdown_1y=self._safe_get(meta, ["drawdown1Y"], default=0.2),
-        )
+        growth = _build_growth(fundamentals, meta)
+        quality = _build_quality(fundamentals, meta)
+        catalysts = _build_catalysts(fundamentals, meta)
+        valuation = _build_valuation(fundamentals, meta)
+        risk = _build_risk(fundamentals, meta)
 
         sector = meta.get("sector") or self._safe_get(fundamentals, ["profile", "sector"], default=None)
         industry = meta.get("industry") or self._safe_get(fundamentals, ["profile", "industry"], default=None)
@@ -3,12 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Iterable, Optional
 
-import pandas as pd
+import numpy as np
 
 from .metrics import ScoreBreakdown, WeightConfig
 from app.core.backtesting import BacktestResult
 
 
+_FACTORS = ("growth", "quality", "catalysts", "valuation", "risk")
+
+
 @dataclass(slots=True)
 class WeightOptimization:
     recommended: WeightConfig
@@ -24,41 +27,44 @@ def recommend_weights(
     if not scores_list or not tests_list:
         return None
 
-    score_df = pd.DataFrame(
-        [
-            {
-                "ticker": score.ticker,
-                "growth": score.growth,
-                "quality": score.quality,
-                "catalysts": score.catalysts,
-                "valuation": score.valuation,
-                "risk": score.risk,
-            }
-            for score in scores_list
-        ]
-    )
-    backtest_df = pd.DataFrame(
-        [
-            {
-                "ticker": result.ticker,
-                "cagr": result.cagr,
-            }
-            for result in tests_list
-        ]
-    )
-
-    merged = score_df.merge(backtest_df, on="ticker", how="inner")
-    if merged.empty or merged["cagr"].abs().sum() == 0:
+    # Inner join on ticker via dict lookups; factor rows stay in score order.
+    row_by_ticker = {score.ticker: row for row, score in enumerate(scores_list)}
+    cagr_by_ticker = {result.ticker: result.cagr for result in tests_list}
+    overlap = [ticker for ticker in row_by_ticker if ticker in cagr_by_ticker]
+    if not overlap:
+        return None
+    cagr = np.fromiter((cagr_by_ticker[ticker] for ticker in overlap), dtype=np.float64, count=len(overlap))
+    if np.nansum(np.abs(cagr)) == 0:
         return None
 
-    correlations: Dict[str, float] = {}
-    weights: Dict[str, float] = {}
-    for factor in ("growth", "quality", "catalysts", "valuation", "risk"):
-        corr = merged[factor].corr(merged["cagr"])
-        if pd.isna(corr):
-            corr = 0.0
-        correlations[factor] = float(corr)
-        weights[factor] = max(corr, 0.0)
+    # One typed fill of an (n, 6) buffer: five factor columns plus CAGR.
+    overlap_scores = (scores_list[row_by_ticker[ticker]] for ticker in overlap)
+    values = np.fromiter(
+        (
+            (score.growth, score.quality, score.catalysts, score.valuation, score.risk, ticker_cagr)
+            for score, ticker_cagr in zip(overlap_scores, cagr.tolist())
+        ),
+        dtype=np.dtype((np.float64, len(_FACTORS) + 1)),
+        count=len(overlap),
+    )
+    # Pearson r of each factor against CAGR, column-wise. Like pandas' corr, each pair
+    # only uses rows where both values are present: the rest are zeroed out of the
+    # means and the centred products. Zero-variance pairs (and single-row inputs)
+    # give 0/0 and are reported as 0.
+    finite = np.isfinite(values)
+    pairs = finite[:, :-1] & finite[:, -1:]
+    factors = np.where(pairs, values[:, :-1], 0.0)
+    returns = np.where(pairs, values[:, -1:], 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        counts = pairs.sum(axis=0)
+        factors = np.where(pairs, factors - factors.sum(axis=0) / counts, 0.0)
+        returns = np.where(pairs, returns - returns.sum(axis=0) / counts, 0.0)
+        covariances = np.einsum("ij,ij->j", factors, returns)
+        norms = np.sqrt(np.einsum("ij,ij->j", factors, factors) * np.einsum("ij,ij->j", returns, returns))
+        corrs = covariances / norms
+    corrs = np.nan_to_num(corrs, nan=0.0, posinf=0.0, neginf=0.0)
+    correlations: Dict[str, float] = dict(zip(_FACTORS, corrs.tolist()))
+    weights: Dict[str, float] = dict(zip(_FACTORS, np.clip(corrs, 0.0, None).tolist()))
 
     proposed = WeightConfig(
         growth=weights["growth"],
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from app.core import jsonio
+
+# Upper bound on memoized key -> path entries; the map is simply reset when full.
+_PATH_CACHE_SIZE = 4096
+# Parsed entries kept in process so repeated lookups skip the disk round-trip.
+_MEMORY_CACHE_SIZE = 512
 
 
 @dataclass(slots=True)
@@ -30,35 +39,67 @@ class JsonCache:
         self.base_dir = base_dir or Path.home() / ".growth_picker" / "cache"
         self.directory = self.base_dir / namespace
         self.directory.mkdir(parents=True, exist_ok=True)
+        self._paths: Dict[str, Path] = {}
+        self._memory: "OrderedDict[Path, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
 
     def _path_for(self, key: str) -> Path:
-        sanitized = key.replace("/", "_").upper()
-        return self.directory / f"{sanitized}.json"
-
-    def _read_payload(self, key: str) -> Optional[Dict[str, Any]]:
-        path = self._path_for(key)
-        if not path.exists():
-            return None
+        path = self._paths.get(key)
+        if path is None:
+            if len(self._paths) >= _PATH_CACHE_SIZE:
+                self._paths.clear()
+            sanitized = key.replace("/", "_").upper()
+            path = self._paths[key] = self.directory / f"{sanitized}.json"
+        return path
+
+    @staticmethod
+    def _read_payload(path: Path) -> Optional[Dict[str, Any]]:
         try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
+            return jsonio.loads(path.read_bytes())
+        except (jsonio.JSONDecodeError, OSError):
             return None
 
     def load(self, key: str) -> Optional[Dict[str, Any]]:
-        payload = self._read_payload(key)
-        if payload is None:
+        path = self._path_for(key)
+        with self._memory_lock:
+            entry = self._memory.get(path)
+            if entry is not None:
+                self._memory.move_to_end(path)
+        if entry is not None:
+            fetched_at, data = entry
+            if self.ttl_seconds and time.time() - fetched_at > self.ttl_seconds:
+                return None
+            return data
+
+        # ``save`` stamps the file mtime with the fetch time, so stale entries are
+        # rejected from a stat call without parsing the body.
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+        if self.ttl_seconds and time.time() - mtime > self.ttl_seconds:
             return None
 
-        fetched_at = float(payload.get("_fetched_at", 0))
-        if self.ttl_seconds and time.time() - fetched_at > self.ttl_seconds:
+        payload = self._read_payload(path)
+        if payload is None:
             return None
-        return payload.get("data")
+        data = payload.get("data")
+        if data is not None:
+            self._remember(path, mtime, data)
+        return data
 
     def get_record(self, key: str) -> Optional[CacheRecord]:
-        payload = self._read_payload(key)
-        if payload is None:
+        # The fetch time lives in memory or in the file mtime, so staleness checks never
+        # parse the payload.
+        path = self._path_for(key)
+        with self._memory_lock:
+            entry = self._memory.get(path)
+        if entry is not None:
+            return CacheRecord(key=key, fetched_at=entry[0])
+        try:
+            fetched_at = path.stat().st_mtime
+        except OSError:
             return None
-        fetched_at = float(payload.get("_fetched_at", 0))
         if not fetched_at:
             return None
         return CacheRecord(key=key, fetched_at=fetched_at)
@@ -77,21 +118,52 @@ class JsonCache:
             return False
         return age > threshold
 
-    def save(self, key: str, data: Dict[str, Any]) -> None:
-        path = self._path_for(key)
-        wrapped = {"_fetched_at": time.time(), "data": data}
-        path.write_text(json.dumps(wrapped))
+    def save(self, key: str, data: Dict[str, Any], *, fetched_at: Optional[float] = None) -> None:
+        """Write ``data`` stamped now, or at ``fetched_at`` when rewriting an existing entry."""
+
+        self._write(self._path_for(key), data, time.time() if fetched_at is None else fetched_at)
+
+    def save_many(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Write several entries with a single shared fetch timestamp."""
+
+        now = time.time()
+        write = self._write
+        path_for = self._path_for
+        for key, data in entries.items():
+            write(path_for(key), data, now)
+
+    def _write(self, path: Path, data: Dict[str, Any], fetched_at: float) -> None:
+        # Temp file + os.replace keeps readers off half-written files; no fsync since
+        # the cache can always be rebuilt from the providers.
+        jsonio.write_atomic(path, jsonio.dumps({"_fetched_at": fetched_at, "data": data}))
+        os.utime(path, (fetched_at, fetched_at))
+        self._remember(path, fetched_at, data)
+
+    def _remember(self, path: Path, fetched_at: float, data: Dict[str, Any]) -> None:
+        with self._memory_lock:
+            self._memory[path] = (fetched_at, data)
+            self._memory.move_to_end(path)
+            if len(self._memory) > _MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
 
     def purge_expired(self) -> None:
         if self.ttl_seconds == 0:
             return
         now = time.time()
-        for path in self.directory.glob("*.json"):
-            try:
-                payload = json.loads(path.read_text())
-            except (json.JSONDecodeError, OSError):
-                path.unlink(missing_ok=True)
-                continue
-            fetched_at = float(payload.get("_fetched_at", 0))
-            if now - fetched_at > self.ttl_seconds:
-                path.unlink(missing_ok=True)
+        with self._memory_lock:
+            expired = [path for path, (fetched_at, _) in self._memory.items() if now - fetched_at > self.ttl_seconds]
+            for path in expired:
+                del self._memory[path]
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if now - mtime > self.ttl_seconds:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
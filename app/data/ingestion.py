@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 from app.core.metrics import CompanyIndicators
 from app.core.pipeline import IndicatorPipeline, PipelineConfig
+from app.core.prices import latest_close, to_columnar
 from app.data.providers import (
     BaseProvider,
     FailoverProvider,
@@ -20,6 +23,9 @@ from .credentials import resolve_api_key
 from .cache import JsonCache
 from .sample_provider import SampleProvider
 
+# Refreshes are dominated by provider round-trips; keep the pool small enough for rate limits.
+_MAX_REFRESH_WORKERS = 8
+
 
 @dataclass(slots=True)
 class ProviderHealthStatus:
@@ -37,27 +43,36 @@ class ProviderHealthStatus:
         }
 
 
+# (last_success_at, last_error, last_error_at)
+_HealthSlots = Tuple[Optional[float], Optional[str], Optional[float]]
+_EMPTY_HEALTH: _HealthSlots = (None, None, None)
+
+
 class ProviderHealthMonitor:
-    """Track basic availability metrics for data providers."""
+    """Track basic availability metrics for data providers.
+
+    Each provider's state is an immutable tuple that is swapped in with a single dict
+    store, so worker threads can record results without a lock and ``snapshot`` never
+    observes a half-updated status.
+    """
 
     def __init__(self, provider_names: Iterable[str]) -> None:
-        self._statuses: Dict[str, ProviderHealthStatus] = {
-            name: ProviderHealthStatus(name=name) for name in provider_names
-        }
+        self._slots: Dict[str, _HealthSlots] = {name: _EMPTY_HEALTH for name in provider_names}
 
     def record_success(self, name: str) -> None:
-        status = self._statuses.setdefault(name, ProviderHealthStatus(name=name))
-        status.last_success_at = time.time()
-        status.last_error = None
-        status.last_error_at = None
+        self._slots[name] = (time.time(), None, None)
 
     def record_failure(self, name: str, message: str) -> None:
-        status = self._statuses.setdefault(name, ProviderHealthStatus(name=name))
-        status.last_error = message
-        status.last_error_at = time.time()
+        last_success_at = self._slots.get(name, _EMPTY_HEALTH)[0]
+        self._slots[name] = (last_success_at, message, time.time())
 
     def snapshot(self) -> List[ProviderHealthStatus]:
-        return list(self._statuses.values())
+        return [
+            ProviderHealthStatus(
+                name=name, last_success_at=success_at, last_error=error, last_error_at=error_at
+            )
+            for name, (success_at, error, error_at) in list(self._slots.items())
+        ]
 
 
 @dataclass(slots=True)
@@ -93,7 +108,56 @@ class DataIngestionManager:
     def get_company(
         self, ticker: str, *, name: Optional[str] = None, force_refresh: bool = False
     ) -> IngestionResult:
+        result, fresh_indicators, fresh_prices = self._collect(ticker, name=name, force_refresh=force_refresh)
+        if fresh_indicators is not None:
+            self.indicator_cache.save(result.ticker, fresh_indicators)
+        if fresh_prices is not None:
+            self.price_cache.save(result.ticker, fresh_prices)
+        return result
+
+    def get_companies(
+        self, tickers: Iterable[str], *, force_refresh: bool = False
+    ) -> List[Tuple[str, Union[IngestionResult, Exception]]]:
+        """Fetch several companies concurrently, in first-seen ticker order.
+
+        Each ticker is paired with its result or with the exception that aborted it, so
+        one failing ticker does not hide the others.
+        """
+
+        ticker_list = _unique_tickers(tickers)
+        outcomes: List[Tuple[str, Union[IngestionResult, Exception]]] = []
+        if not ticker_list:
+            return outcomes
+        indicator_updates: Dict[str, Dict[str, Any]] = {}
+        price_updates: Dict[str, Dict[str, Any]] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(_MAX_REFRESH_WORKERS, len(ticker_list))) as executor:
+                futures = [
+                    executor.submit(self._collect, ticker, force_refresh=force_refresh) for ticker in ticker_list
+                ]
+                for ticker, future in zip(ticker_list, futures):
+                    try:
+                        result, fresh_indicators, fresh_prices = future.result()
+                    except Exception as exc:  # noqa: BLE001 - reported per ticker
+                        outcomes.append((ticker, exc))
+                        continue
+                    if fresh_indicators is not None:
+                        indicator_updates[result.ticker] = fresh_indicators
+                    if fresh_prices is not None:
+                        price_updates[result.ticker] = fresh_prices
+                    outcomes.append((ticker, result))
+        finally:
+            self.indicator_cache.save_many(indicator_updates)
+            self.price_cache.save_many(price_updates)
+        return outcomes
+
+    def _collect(
+        self, ticker: str, *, name: Optional[str] = None, force_refresh: bool = False
+    ) -> Tuple[IngestionResult, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Fetch a company, returning freshly fetched payloads for the caller to cache."""
+
         ticker = ticker.upper()
+        fresh_indicators: Optional[Dict[str, Any]] = None
         cached_indicators = None if force_refresh else self.indicator_cache.load(ticker)
         if cached_indicators is not None:
             indicators = CompanyIndicators.from_dict(cached_indicators)
@@ -104,8 +168,9 @@ class DataIngestionManager:
             except Exception as exc:  # noqa: BLE001
                 self.health_monitor.record_failure("primary", str(exc))
                 raise
-            self.indicator_cache.save(ticker, indicators.to_dict())
+            fresh_indicators = indicators.to_dict()
 
+        fresh_prices: Optional[Dict[str, Any]] = None
         cached_prices = None if force_refresh else self.price_cache.load(ticker)
         if cached_prices is None:
             provider = self.pipeline.config.providers.get("primary")
@@ -120,17 +185,29 @@ class DataIngestionManager:
                     price_history = None
             else:
                 price_history = None
-            if price_history is not None:
-                self.price_cache.save(ticker, price_history)
+            fresh_prices = price_history
         else:
-            price_history = cached_prices
+            # Entries cached before the columnar layout still hold candle lists; convert
+            # them once and write the result back, keeping the original fetch time.
+            price_history = to_columnar(cached_prices)
+            if price_history is not cached_prices:
+                self.price_cache.save(ticker, price_history, fetched_at=self.price_cache.last_fetched(ticker))
 
-        return IngestionResult(ticker=ticker, indicators=indicators, price_history=price_history)
+        result = IngestionResult(ticker=ticker, indicators=indicators, price_history=price_history)
+        return result, fresh_indicators, fresh_prices
 
     def refresh_many(self, tickers: Iterable[str]) -> List[IngestionResult]:
+        """Force-refresh several companies concurrently, raising the first failure.
+
+        Built on ``get_companies``, so every ticker that did refresh is cached before the
+        error propagates.
+        """
+
         results: List[IngestionResult] = []
-        for ticker in tickers:
-            results.append(self.get_company(ticker, force_refresh=True))
+        for _, outcome in self.get_companies(tickers, force_refresh=True):
+            if isinstance(outcome, Exception):
+                raise outcome
+            results.append(outcome)
         return results
 
     def ensure_auto_refresh(
@@ -140,68 +217,95 @@ class DataIngestionManager:
         stale_after_seconds: float = 4 * 60 * 60,
     ) -> AutoRefreshSummary:
         summary = AutoRefreshSummary()
-        for ticker in tickers:
-            ticker = ticker.upper()
-            if not ticker:
-                continue
+        candidates = _unique_tickers(tickers)
+        stale: List[str] = []
+        for ticker in candidates:
             indicator_stale = self.indicator_cache.is_stale(ticker, max_age=stale_after_seconds)
             price_stale = self.price_cache.is_stale(ticker, max_age=stale_after_seconds)
             if indicator_stale or price_stale:
-                try:
-                    self.get_company(ticker, force_refresh=True)
-                    summary.refreshed.append(ticker)
-                except Exception:  # noqa: BLE001
-                    summary.skipped.append(ticker)
+                stale.append(ticker)
+
+        refreshed: Dict[str, bool] = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(_MAX_REFRESH_WORKERS, len(stale))) as executor:
+                refreshed = dict(zip(stale, executor.map(self._refresh_quietly, stale)))
+
+        for ticker in candidates:
+            if refreshed.get(ticker):
+                summary.refreshed.append(ticker)
             else:
                 summary.skipped.append(ticker)
         return summary
 
+    def _refresh_quietly(self, ticker: str) -> bool:
+        try:
+            self.get_company(ticker, force_refresh=True)
+        except Exception:  # noqa: BLE001
+            return False
+        return True
+
     def get_provider_health(self) -> List[ProviderHealthStatus]:
         return self.health_monitor.snapshot()
 
     def latest_close(self, ticker: str) -> Optional[float]:
-        ticker = ticker.upper()
-        payload = self.price_cache.load(ticker)
-        if payload is None:
-            return None
-        candles = payload.get("candles")
-        if not candles:
-            return None
-        last = candles[-1]
-        try:
-            return float(last.get("close"))
-        except (TypeError, ValueError):
-            return None
+        return latest_close(self.price_cache.load(ticker.upper()))
+
+    def latest_closes(self, tickers: Iterable[str]) -> Dict[str, Optional[float]]:
+        """Latest cached close per ticker, looking each distinct ticker up once."""
+
+        return {ticker: self.latest_close(ticker) for ticker in dict.fromkeys(tickers)}
 
     @staticmethod
     def _normalize_price_response(response: Dict[str, Any]) -> Dict[str, Any]:
-        if "candles" in response:
+        """Reshape a provider price response into ``{"dates", "closes", "symbol"}`` columns."""
+
+        if "closes" in response:
             return response
 
+        if "candles" in response:
+            return to_columnar(response)
+
         if {"c", "t"}.issubset(response.keys()):  # Finnhub style arrays
-            candles = []
-            closes = response.get("c", [])
-            timestamps = response.get("t", [])
-            for ts, close in zip(timestamps, closes):
-                dt = datetime.fromtimestamp(float(ts), tz=timezone.utc)
-                candles.append({"date": dt.date().isoformat(), "close": float(close)})
-            return {"candles": candles, "symbol": response.get("symbol")}
+            closes = response.get("c") or []
+            timestamps = response.get("t") or []
+            count = min(len(closes), len(timestamps))
+            # Epoch seconds -> UTC calendar days -> ISO strings, all inside NumPy.
+            dates = (
+                np.asarray(timestamps[:count], dtype=np.float64)
+                .astype(np.int64)
+                .astype("datetime64[s]")
+                .astype("datetime64[D]")
+                .astype(str)
+                .tolist()
+            )
+            close_values = np.asarray(closes[:count], dtype=np.float64).tolist()
+            return {"dates": dates, "closes": close_values, "symbol": response.get("symbol")}
 
         if "values" in response:  # Twelve Data time series
-            candles = []
-            for entry in response.get("values", []):
-                candles.append({"date": entry.get("datetime"), "close": float(entry.get("close", 0.0))})
-            return {"candles": candles, "symbol": response.get("symbol")}
-
-        if "historical" in response:  # FMP historical series
-            candles = []
-            for entry in response.get("historical", []):
-                candles.append({"date": entry.get("date"), "close": float(entry.get("close", 0.0))})
-            return {"candles": list(reversed(candles)), "symbol": response.get("symbol")}
+            entries = response.get("values", [])
+            return {
+                "dates": [entry.get("datetime") for entry in entries],
+                "closes": [float(entry.get("close", 0.0)) for entry in entries],
+                "symbol": response.get("symbol"),
+            }
+
+        if "historical" in response:  # FMP historical series, newest first
+            entries = response.get("historical", [])[::-1]
+            return {
+                "dates": [entry.get("date") for entry in entries],
+                "closes": [float(entry.get("close", 0.0)) for entry in entries],
+                "symbol": response.get("symbol"),
+            }
 
         return response
 
 
+def _unique_tickers(tickers: Iterable[str]) -> List[str]:
+    """Upper-cased tickers in first-seen order, without blanks or duplicates."""
+
+    return list(dict.fromkeys(ticker.upper() for ticker in tickers if ticker))
+
+
 def build_default_manager() -> DataIngestionManager:
     providers: Dict[str, BaseProvider] = {}
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import abc
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core import jsonio
 
 
 if TYPE_CHECKING:  # pragma: no cover - circular import guard
@@ -15,6 +20,27 @@ class DataProviderError(RuntimeError):
     """Raised when a data provider returns an error response."""
 
 
+# Sized above the ingestion/pipeline worker pools so concurrent fetches reuse
+# kept-alive connections instead of opening (and TLS-negotiating) new ones.
+_POOL_SIZE = 32
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    retries = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        # Hand the final response back so ``_get`` reports the status as usual.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @dataclass(slots=True)
 class ProviderConfig:
     base_url: str
@@ -23,7 +49,9 @@ class ProviderConfig:
 
     def get_session(self) -> requests.Session:
         if self.session is None:
-            self.session = requests.Session()
+            with _session_lock:
+                if self.session is None:
+                    self.session = _build_session()
         return self.session
 
 
@@ -32,19 +60,23 @@ class BaseProvider(abc.ABC):
 
     def __init__(self, config: Optional[ProviderConfig] = None) -> None:
         self.config = config
+        self._auth: Optional[Dict[str, Any]] = None
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         if self.config is None:
             raise DataProviderError("HTTP provider is missing configuration")
-        params = params or {}
-        params = {**params, **self._auth_params()}
+        auth = self._auth
+        if auth is None:
+            auth = self._auth = self._auth_params()
+        params = {**params, **auth} if params else auth
         url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         response = self.config.get_session().get(url, params=params, timeout=30)
         if response.status_code != 200:
             raise DataProviderError(
                 f"{self.__class__.__name__} returned {response.status_code}: {response.text}"
             )
-        return response.json()
+        # Parse the raw body directly rather than decoding it to text first.
+        return jsonio.loads(response.content)
 
     @abc.abstractmethod
     def _auth_params(self) -> Dict[str, Any]:
@@ -59,6 +91,10 @@ class BaseProvider(abc.ABC):
         """Fetch historical price series."""
 
 
+# Generic interval names -> Finnhub candle resolutions; anything else is passed through.
+_FINNHUB_RESOLUTIONS = {"1day": "D", "1d": "D", "1week": "W", "1month": "M"}
+
+
 class FinnhubProvider(BaseProvider):
     def _auth_params(self) -> Dict[str, Any]:
         return {"token": self.config.api_key}
@@ -67,9 +103,7 @@ class FinnhubProvider(BaseProvider):
         return self._get("stock/metric", {"symbol": ticker, "metric": "all"})
 
     def price_series(self, ticker: str, *, interval: str = "D", limit: int = 365) -> Dict[str, Any]:
-        resolution = interval
-        if interval.lower() in {"1day", "1d"}:
-            resolution = "D"
+        resolution = _FINNHUB_RESOLUTIONS.get(interval.lower(), interval)
         return self._get(
             "stock/candle",
             {"symbol": ticker, "resolution": resolution, "count": limit},
@@ -82,9 +82,7 @@ SAMPLE_FUNDAMENTALS = {
 }
 
 
-def load_sample_companies() -> list[CompanyIndicators]:
-    """Provide sample companies approximating Celestica-like setups."""
-
+def _build_sample_companies() -> tuple[CompanyIndicators, ...]:
     companies: list[CompanyIndicators] = []
     for ticker, fundamentals in SAMPLE_FUNDAMENTALS.items():
         metadata = {
@@ -146,4 +144,17 @@ def load_sample_companies() -> list[CompanyIndicators]:
                 metadata=metadata,
             )
         )
-    return companies
+    return tuple(companies)
+
+
+# SAMPLE_FUNDAMENTALS is constant, so the indicator objects are built once at import.
+_SAMPLE_COMPANIES = _build_sample_companies()
+
+
+def load_sample_companies() -> list[CompanyIndicators]:
+    """Provide sample companies approximating Celestica-like setups.
+
+    The returned instances are shared between calls; treat them as read-only.
+    """
+
+    return list(_SAMPLE_COMPANIES)
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
-from typing import Dict, List
+from datetime import date
+from typing import Any, Dict, List
 
 
-def _build_price_series(start: date, values: List[float]) -> List[Dict[str, str | float]]:
-    series: List[Dict[str, str | float]] = []
-    current = start
-    for price in values:
-        series.append({"date": current.isoformat(), "close": price})
-        current += timedelta(days=30)
-    return series
+def _build_price_series(start: date, values: List[float]) -> Dict[str, List[Any]]:
+    # Columnar like cached price payloads; candles are 30 days apart, stepped in day ordinals.
+    start_ordinal = start.toordinal()
+    return {
+        "dates": [date.fromordinal(start_ordinal + 30 * index).isoformat() for index in range(len(values))],
+        "closes": list(values),
+    }
 
 
-SAMPLE_PRICE_SERIES: Dict[str, List[Dict[str, str | float]]] = {
+SAMPLE_PRICE_SERIES: Dict[str, Dict[str, List[Any]]] = {
     "CLS": _build_price_series(
         date(2022, 1, 1),
         [
@@ -100,10 +100,10 @@ def load_price_frame(ticker: str):  # pragma: no cover - convenience wrapper
     except ModuleNotFoundError:  # pragma: no cover - pandas always installed in app context
         raise RuntimeError("pandas is required for price history visualization") from None
 
-    records = SAMPLE_PRICE_SERIES.get(ticker.upper())
-    if records is None:
+    series = SAMPLE_PRICE_SERIES.get(ticker.upper())
+    if series is None:
         raise KeyError(f"No sample price series for {ticker}")
-    return pd.DataFrame(records)
+    return pd.DataFrame({"date": series["dates"], "close": series["closes"]})
 
 
 def load_fundamental_history(ticker: str):  # pragma: no cover - convenience wrapper
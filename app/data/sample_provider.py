@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict
 
 from app.data.providers import BaseProvider, ProviderConfig
@@ -18,10 +19,25 @@ class SampleProvider(BaseProvider):
         return {}
 
     def fundamentals(self, ticker: str) -> Dict[str, Any]:
-        ticker = ticker.upper()
-        return SAMPLE_FUNDAMENTALS.get(ticker, SAMPLE_FUNDAMENTALS["CLS"])
+        return _sample_fundamentals(ticker)
 
     def price_series(self, ticker: str, *, interval: str = "1day", limit: int = 365) -> Dict[str, Any]:
-        ticker = ticker.upper()
-        series = SAMPLE_PRICE_SERIES.get(ticker, SAMPLE_PRICE_SERIES["CLS"])
-        return {"symbol": ticker, "candles": series[:limit], "interval": interval}
+        return _sample_price_series(ticker, interval, limit)
+
+
+# The sample universe is a handful of fixed payloads, so lookups are memoized on the raw
+# arguments; results are shared and must be treated as read-only.
+@lru_cache(maxsize=128)
+def _sample_fundamentals(ticker: str) -> Dict[str, Any]:
+    return SAMPLE_FUNDAMENTALS.get(ticker.upper(), SAMPLE_FUNDAMENTALS["CLS"])
+
+
+@lru_cache(maxsize=128)
+def _sample_price_series(ticker: str, interval: str, limit: int) -> Dict[str, Any]:
+    ticker = ticker.upper()
+    series = SAMPLE_PRICE_SERIES.get(ticker, SAMPLE_PRICE_SERIES["CLS"])
+    dates, closes = series["dates"], series["closes"]
+    # Hand out the shared columns untouched unless they actually need trimming.
+    if limit < len(closes):
+        dates, closes = dates[:limit], closes[:limit]
+    return {"symbol": ticker, "dates": dates, "closes": closes, "interval": interval}
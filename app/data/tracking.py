@@ -1,19 +1,93 @@
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from app.core import jsonio
 from app.core.metrics import ScoreBreakdown
+from app.core.prices import latest_close
 from app.data.ingestion import DataIngestionManager
 
 
+@dataclass(slots=True)
+class SnapshotEntry:
+    """One ranked company in a snapshot: its score breakdown plus the captured prices."""
+
+    ticker: str
+    name: str
+    growth: float
+    quality: float
+    catalysts: float
+    valuation: float
+    risk: float
+    composite: float
+    recorded_price: Optional[float] = None
+    target_price: Optional[float] = None
+    weights: Optional[Dict[str, float]] = None
+
+    @classmethod
+    def from_score(
+        cls, score: ScoreBreakdown, *, recorded_price: Optional[float], target_price: Optional[float]
+    ) -> "SnapshotEntry":
+        return cls(
+            ticker=score.ticker,
+            name=score.name,
+            growth=score.growth,
+            quality=score.quality,
+            catalysts=score.catalysts,
+            valuation=score.valuation,
+            risk=score.risk,
+            composite=score.composite,
+            recorded_price=recorded_price,
+            target_price=target_price,
+            weights=score.weights.to_dict() if score.weights is not None else None,
+        )
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "SnapshotEntry":
+        weights = payload.get("weights")
+        return cls(
+            ticker=str(payload.get("ticker") or ""),
+            name=str(payload.get("name") or ""),
+            growth=_safe_float(payload.get("growth")) or 0.0,
+            quality=_safe_float(payload.get("quality")) or 0.0,
+            catalysts=_safe_float(payload.get("catalysts")) or 0.0,
+            valuation=_safe_float(payload.get("valuation")) or 0.0,
+            risk=_safe_float(payload.get("risk")) or 0.0,
+            composite=_safe_float(payload.get("composite")) or 0.0,
+            recorded_price=_safe_float(payload.get("recorded_price")),
+            target_price=_safe_float(payload.get("target_price")),
+            weights=weights if isinstance(weights, dict) else None,
+        )
+
+    def to_dict(self) -> dict:
+        data = {
+            "ticker": self.ticker,
+            "name": self.name,
+            "growth": self.growth,
+            "quality": self.quality,
+            "catalysts": self.catalysts,
+            "valuation": self.valuation,
+            "risk": self.risk,
+            "composite": self.composite,
+            "recorded_price": self.recorded_price,
+            "target_price": self.target_price,
+        }
+        if self.weights is not None:
+            data["weights"] = self.weights
+        return data
+
+
 @dataclass(slots=True)
 class RankingSnapshot:
     created_at: str
-    entries: List[dict]
+    entries: List[SnapshotEntry]
+
+    def to_dict(self) -> dict:
+        return {"created_at": self.created_at, "entries": [entry.to_dict() for entry in self.entries]}
 
 
 @dataclass(slots=True)
@@ -30,8 +104,11 @@ class SnapshotPerformance:
 
 class RankingTracker:
     def __init__(self, path: Path | None = None) -> None:
-        self.path = path or (Path.home() / ".growth_picker" / "rankings.json")
+        self.path = path or (Path.home() / ".growth_picker" / "rankings.jsonl")
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Parsed history keyed on the file's (mtime_ns, size) so unchanged files skip the parse.
+        self._cached: Optional[Tuple[Tuple[int, int], List[RankingSnapshot]]] = None
+        self._migrate_legacy()
 
     def append(
         self,
@@ -40,114 +117,175 @@ class RankingTracker:
         price_lookup: Optional[Dict[str, Dict[str, object]]] = None,
     ) -> RankingSnapshot:
         price_lookup = price_lookup or {}
-        snapshot = RankingSnapshot(
-            created_at=datetime.utcnow().isoformat(timespec="seconds"),
-            entries=[
-                {
-                    **score.to_dict(),
-                    "recorded_price": self._latest_close_from_payload(price_lookup.get(score.ticker)),
-                    "target_price": self._target_price(price_lookup.get(score.ticker)),
-                }
-                for score in scores
-            ],
-        )
-        history = self.load_history()
-        history.append(snapshot)
-        self.path.write_text(
-            json.dumps([snapshot.__dict__ for snapshot in history], indent=2)
-        )
+        created_at = datetime.utcnow().isoformat(timespec="seconds")
+        lookup = price_lookup.get
+        entries: List[SnapshotEntry] = []
+        for score in scores:
+            # The target is derived from the same close, so read the payload once per ticker.
+            recorded_price = latest_close(lookup(score.ticker))
+            entries.append(
+                SnapshotEntry.from_score(
+                    score,
+                    recorded_price=recorded_price,
+                    target_price=self._target_from_close(recorded_price),
+                )
+            )
+        snapshot = RankingSnapshot(created_at=created_at, entries=entries)
+        # History is JSON Lines, so recording a run appends one line instead of
+        # rewriting every earlier snapshot.
+        line = self._encode_line(snapshot)
+        if not self._ends_with_newline():
+            line = b"\n" + line  # keep a torn trailing line from swallowing this one
+        with self.path.open("ab") as handle:
+            handle.write(line)
         return snapshot
 
     def load_history(self) -> List[RankingSnapshot]:
-        if not self.path.exists():
+        try:
+            stat = self.path.stat()
+        except OSError:
             return []
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._cached is not None and self._cached[0] == signature:
+            return list(self._cached[1])
+        history = self._parse_history()
+        self._cached = (signature, history)
+        return list(history)
+
+    def _parse_history(self) -> List[RankingSnapshot]:
         try:
-            raw = json.loads(self.path.read_text())
-        except (json.JSONDecodeError, OSError):
+            data = self.path.read_bytes()
+        except OSError:
             return []
-        history: List[RankingSnapshot] = []
-        for entry in raw:
-            history.append(
-                RankingSnapshot(
-                    created_at=str(entry.get("created_at", "")),
-                    entries=self._normalize_entries(entry),
-                )
-            )
-        return history
+        return self._snapshots(self._parse_lines(data))
+
+    def _migrate_legacy(self) -> None:
+        """Convert history written by older versions to JSON Lines, once.
+
+        Those wrote a single JSON array, by default to ``rankings.json`` (briefly also
+        JSON Lines under that name). A sibling ``rankings.json`` is converted into
+        ``self.path``, and a ``self.path`` that still holds an array is converted in
+        place. The original is kept with a ``.bak`` suffix so this never runs twice.
+        """
+
+        if self.path.exists():
+            source = self.path
+            try:
+                with source.open("rb") as handle:
+                    head = handle.read(64)
+            except OSError:
+                return
+            if not head.lstrip().startswith(b"["):
+                return  # already JSON Lines
+        else:
+            source = self.path.with_suffix(".json")
+        try:
+            data = source.read_bytes()
+        except OSError:
+            return
+        if data.lstrip().startswith(b"["):
+            try:
+                raw = jsonio.loads(data)
+            except jsonio.JSONDecodeError:
+                raw = []
+        else:
+            raw = self._parse_lines(data)
+        history = self._snapshots(raw if isinstance(raw, list) else [])
+        os.replace(source, source.with_name(source.name + ".bak"))
+        jsonio.write_atomic(self.path, b"".join(self._encode_line(item) for item in history))
 
     def build_performance(self, manager: DataIngestionManager) -> List[SnapshotPerformance]:
         performances: List[SnapshotPerformance] = []
-        for snapshot in self.load_history():
+        history = self.load_history()
+        # The same tickers recur across snapshots; resolve each one's latest close once.
+        latest_prices: Dict[str, Optional[float]] = {}
+        if manager:
+            latest_prices = manager.latest_closes(
+                entry.ticker for snapshot in history for entry in snapshot.entries if entry.ticker
+            )
+        for snapshot in history:
             for entry in snapshot.entries:
-                ticker = entry.get("ticker")
+                ticker = entry.ticker
                 if not ticker:
                     continue
-                recorded_price = self._safe_float(entry.get("recorded_price"))
-                latest_price = manager.latest_close(ticker) if manager else None
+                recorded_price = entry.recorded_price
+                latest_price = latest_prices.get(ticker)
                 return_since = None
                 target_met = False
                 if recorded_price and latest_price:
                     return_since = (latest_price / recorded_price) - 1
-                    target_price = self._safe_float(entry.get("target_price"))
+                    target_price = entry.target_price
                     target_met = bool(target_price and latest_price >= target_price)
                 performances.append(
                     SnapshotPerformance(
                         run_timestamp=snapshot.created_at,
                         ticker=ticker,
-                        name=str(entry.get("name", "")),
+                        name=entry.name,
                         recorded_price=recorded_price,
                         latest_price=latest_price,
                         return_since_capture=return_since,
                         target_met=target_met,
-                        composite=float(entry.get("composite", 0.0)),
+                        composite=entry.composite,
                     )
                 )
         return performances
 
+    def _ends_with_newline(self) -> bool:
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(0, os.SEEK_END)
+                if handle.tell() == 0:
+                    return True
+                handle.seek(-1, os.SEEK_END)
+                return handle.read(1) == b"\n"
+        except OSError:
+            return True
+
     @staticmethod
-    def _normalize_entries(entry: dict) -> List[dict]:
-        scores = entry.get("entries")
-        if isinstance(scores, list):
-            return list(scores)
-        legacy_scores = entry.get("scores")
-        if isinstance(legacy_scores, list):
-            normalized: List[dict] = []
-            for item in legacy_scores:
-                normalized.append(
-                    {
-                        **item,
-                        "recorded_price": None,
-                        "target_price": None,
-                    }
-                )
-            return normalized
-        return []
+    def _parse_lines(data: bytes) -> List[dict]:
+        raw: List[dict] = []
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                raw.append(jsonio.loads(line))
+            except jsonio.JSONDecodeError:
+                continue  # e.g. a line torn by an interrupted write
+        return raw
+
+    @classmethod
+    def _snapshots(cls, raw: Iterable[object]) -> List[RankingSnapshot]:
+        return [
+            RankingSnapshot(created_at=str(entry.get("created_at", "")), entries=cls._normalize_entries(entry))
+            for entry in raw
+            if isinstance(entry, dict)
+        ]
 
     @staticmethod
-    def _latest_close_from_payload(payload: Optional[Dict[str, object]]) -> Optional[float]:
-        if not payload:
-            return None
-        candles = payload.get("candles") if isinstance(payload, dict) else None
-        if not candles:
-            return None
-        last = candles[-1]
-        try:
-            return float(last.get("close"))
-        except (TypeError, ValueError, AttributeError):
-            return None
+    def _encode_line(snapshot: RankingSnapshot) -> bytes:
+        return jsonio.dumps(snapshot.to_dict()) + b"\n"
 
     @staticmethod
-    def _target_price(payload: Optional[Dict[str, object]]) -> Optional[float]:
-        latest = RankingTracker._latest_close_from_payload(payload)
+    def _normalize_entries(entry: dict) -> List[SnapshotEntry]:
+        # Older files stored the rows under "scores" without captured prices.
+        scores = entry.get("entries")
+        if not isinstance(scores, list):
+            scores = entry.get("scores")
+        if not isinstance(scores, list):
+            return []
+        return [SnapshotEntry.from_dict(item) for item in scores if isinstance(item, dict)]
+
+    @staticmethod
+    def _target_from_close(latest: Optional[float]) -> Optional[float]:
         if latest is None:
             return None
         return latest * 2
 
-    @staticmethod
-    def _safe_float(value: object) -> Optional[float]:
-        try:
-            if value is None:
-                return None
-            return float(value)
-        except (TypeError, ValueError):
+
+def _safe_float(value: object) -> Optional[float]:
+    try:
+        if value is None:
             return None
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -1,20 +1,38 @@
 from __future__ import annotations
 
-from .utils import weighted_average, smooth_step
-from app.core.metrics import CatalystMetrics, clamp
+from typing import Sequence
+
+import numpy as np
+
+from .utils import ScoreSpec
+from app.core.metrics import CatalystMetrics
+
+
+# (lower, upper, inverse, weight) per component, in ``_values`` order.
+_SPEC = ScoreSpec(
+    (
+        (0.2, 0.9, False, 0.35),  # theme_alignment
+        (0.0, 0.25, False, 0.3),  # earnings_revision_trend
+        (0.0, 0.7, False, 0.2),  # insider_activity_score
+        (0.0, 0.5, False, 0.15),  # strategic_investor_presence
+    )
+)
+
+
+def _values(metrics: CatalystMetrics) -> tuple[float, ...]:
+    return (
+        metrics.theme_alignment,
+        metrics.earnings_revision_trend,
+        metrics.insider_activity_score,
+        metrics.strategic_investor_presence or 0.0,
+    )
 
 
 def score_catalysts(metrics: CatalystMetrics) -> float:
-    components = {
-        "theme": smooth_step(metrics.theme_alignment, lower=0.2, upper=0.9),
-        "earnings": smooth_step(metrics.earnings_revision_trend, lower=0.0, upper=0.25),
-        "insider": smooth_step(metrics.insider_activity_score, lower=0.0, upper=0.7),
-        "strategic": smooth_step((metrics.strategic_investor_presence or 0.0), lower=0.0, upper=0.5),
-    }
-    weights = {
-        "theme": 0.35,
-        "earnings": 0.3,
-        "insider": 0.2,
-        "strategic": 0.15,
-    }
-    return clamp(weighted_average(components, weights))
+    return _SPEC.score(_values(metrics))
+
+
+def score_catalysts_batch(items: Sequence[CatalystMetrics]) -> np.ndarray:
+    """Vectorized ``score_catalysts`` over many companies; returns one score per item."""
+
+    return _SPEC.score_batch([_values(metrics) for metrics in items])
@@ -1,24 +1,42 @@
 from __future__ import annotations
 
-from .utils import weighted_average, smooth_step
-from app.core.metrics import GrowthMetrics, clamp
+from typing import Sequence
+
+import numpy as np
+
+from .utils import ScoreSpec
+from app.core.metrics import GrowthMetrics
+
+
+# (lower, upper, inverse, weight) per component, in ``_values`` order.
+_SPEC = ScoreSpec(
+    (
+        (0.08, 0.35, False, 0.32),  # revenue_cagr_3y
+        (0.0, 0.12, False, 0.22),  # revenue_acceleration
+        (0.0, 0.08, False, 0.18),  # ebit_margin_trend
+        (0.05, 0.2, False, 0.18),  # fcf_margin
+        (0.0, 0.25, False, 0.10),  # backlog_growth
+    )
+)
+
+
+def _values(metrics: GrowthMetrics) -> tuple[float, ...]:
+    return (
+        metrics.revenue_cagr_3y,
+        metrics.revenue_acceleration,
+        metrics.ebit_margin_trend,
+        metrics.fcf_margin,
+        metrics.backlog_growth or 0.0,
+    )
 
 
 def score_growth(metrics: GrowthMetrics) -> float:
     """Score a company on long-horizon fundamental growth momentum."""
 
-    components = {
-        "revenue_cagr": smooth_step(metrics.revenue_cagr_3y, lower=0.08, upper=0.35),
-        "revenue_acceleration": smooth_step(metrics.revenue_acceleration, lower=0.0, upper=0.12),
-        "ebit_margin_trend": smooth_step(metrics.ebit_margin_trend, lower=0.0, upper=0.08),
-        "fcf_margin": smooth_step(metrics.fcf_margin, lower=0.05, upper=0.2),
-        "backlog_growth": smooth_step(metrics.backlog_growth or 0.0, lower=0.0, upper=0.25),
-    }
-    weights = {
-        "revenue_cagr": 0.32,
-        "revenue_acceleration": 0.22,
-        "ebit_margin_trend": 0.18,
-        "fcf_margin": 0.18,
-        "backlog_growth": 0.10,
-    }
-    return clamp(weighted_average(components, weights))
+    return _SPEC.score(_values(metrics))
+
+
+def score_growth_batch(items: Sequence[GrowthMetrics]) -> np.ndarray:
+    """Vectorized ``score_growth`` over many companies; returns one score per item."""
+
+    return _SPEC.score_batch([_values(metrics) for metrics in items])
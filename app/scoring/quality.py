@@ -1,22 +1,40 @@
 from __future__ import annotations
 
-from .utils import weighted_average, smooth_step, inverse_smooth_step
-from app.core.metrics import QualityMetrics, clamp
+from typing import Sequence
+
+import numpy as np
+
+from .utils import ScoreSpec
+from app.core.metrics import QualityMetrics
+
+
+# (lower, upper, inverse, weight) per component, in ``_values`` order.
+_SPEC = ScoreSpec(
+    (
+        (0.08, 0.25, False, 0.3),  # roic
+        (0.0, 0.06, False, 0.2),  # roic_trend
+        (0.0, 2.5, True, 0.2),  # net_debt_to_ebitda
+        (4.0, 15.0, False, 0.2),  # interest_coverage
+        (0.0, 0.15, False, 0.1),  # asset_turnover_trend
+    )
+)
+
+
+def _values(metrics: QualityMetrics) -> tuple[float, ...]:
+    return (
+        metrics.roic,
+        metrics.roic_trend,
+        metrics.net_debt_to_ebitda,
+        metrics.interest_coverage,
+        metrics.asset_turnover_trend,
+    )
 
 
 def score_quality(metrics: QualityMetrics) -> float:
-    components = {
-        "roic": smooth_step(metrics.roic, lower=0.08, upper=0.25),
-        "roic_trend": smooth_step(metrics.roic_trend, lower=0.0, upper=0.06),
-        "leverage": inverse_smooth_step(metrics.net_debt_to_ebitda, lower=0.0, upper=2.5),
-        "coverage": smooth_step(metrics.interest_coverage, lower=4.0, upper=15.0),
-        "asset_turnover": smooth_step(metrics.asset_turnover_trend, lower=0.0, upper=0.15),
-    }
-    weights = {
-        "roic": 0.3,
-        "roic_trend": 0.2,
-        "leverage": 0.2,
-        "coverage": 0.2,
-        "asset_turnover": 0.1,
-    }
-    return clamp(weighted_average(components, weights))
+    return _SPEC.score(_values(metrics))
+
+
+def score_quality_batch(items: Sequence[QualityMetrics]) -> np.ndarray:
+    """Vectorized ``score_quality`` over many companies; returns one score per item."""
+
+    return _SPEC.score_batch([_values(metrics) for metrics in items])
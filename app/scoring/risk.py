@@ -1,22 +1,40 @@
 from __future__ import annotations
 
-from .utils import weighted_average, smooth_step, inverse_smooth_step
-from app.core.metrics import RiskMetrics, clamp
+from typing import Sequence
+
+import numpy as np
+
+from .utils import ScoreSpec
+from app.core.metrics import RiskMetrics
+
+
+# (lower, upper, inverse, weight) per component, in ``_values`` order.
+_SPEC = ScoreSpec(
+    (
+        (3e8, 1e10, False, 0.25),  # market_cap
+        (5e6, 5e7, False, 0.25),  # avg_daily_dollar_volume
+        (0.8, 1.6, True, 0.2),  # beta
+        (0.2, 0.6, True, 0.2),  # volatility_3y
+        (0.15, 0.45, True, 0.1),  # drawdown_1y
+    )
+)
+
+
+def _values(metrics: RiskMetrics) -> tuple[float, ...]:
+    return (
+        metrics.market_cap,
+        metrics.avg_daily_dollar_volume,
+        metrics.beta,
+        metrics.volatility_3y,
+        metrics.drawdown_1y,
+    )
 
 
 def score_risk(metrics: RiskMetrics) -> float:
-    components = {
-        "market_cap": smooth_step(metrics.market_cap, lower=3e8, upper=1e10),
-        "liquidity": smooth_step(metrics.avg_daily_dollar_volume, lower=5e6, upper=5e7),
-        "beta": inverse_smooth_step(metrics.beta, lower=0.8, upper=1.6),
-        "volatility": inverse_smooth_step(metrics.volatility_3y, lower=0.2, upper=0.6),
-        "drawdown": inverse_smooth_step(metrics.drawdown_1y, lower=0.15, upper=0.45),
-    }
-    weights = {
-        "market_cap": 0.25,
-        "liquidity": 0.25,
-        "beta": 0.2,
-        "volatility": 0.2,
-        "drawdown": 0.1,
-    }
-    return clamp(weighted_average(components, weights))
+    return _SPEC.score(_values(metrics))
+
+
+def score_risk_batch(items: Sequence[RiskMetrics]) -> np.ndarray:
+    """Vectorized ``score_risk`` over many companies; returns one score per item."""
+
+    return _SPEC.score_batch([_values(metrics) for metrics in items])
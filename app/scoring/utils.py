@@ -1,37 +1,99 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Sequence, Tuple
 
-from app.core.metrics import clamp
+import numpy as np
 
 
-def weighted_average(values: Dict[str, float], weights: Dict[str, float]) -> float:
-    numerator = sum(values[key] * weights.get(key, 0.0) for key in values)
-    denominator = sum(weights.get(key, 0.0) for key in values)
-    if denominator == 0:
-        return 0.0
-    return numerator / denominator
+def make_smooth_step(lower: float, upper: float) -> Callable[[float], float]:
+    """Map a metric to a 0–1 score rising linearly between fixed bounds.
 
+    The reciprocal range is precomputed once per closure.
+    """
 
-def smooth_step(value: float, *, lower: float, upper: float) -> float:
-    """Map a metric to a 0–1 score using a smooth transition between bounds."""
+    if upper == lower:
+        raise ValueError("smooth_step bounds must differ")
+    inv_range = 1.0 / (upper - lower)
+
+    def step(value: float) -> float:
+        return max(0.0, min(1.0, (value - lower) * inv_range))
+
+    return step
+
+
+def make_inverse_smooth_step(lower: float, upper: float) -> Callable[[float], float]:
+    """Falling counterpart of ``make_smooth_step`` for ratios where lower is better (e.g., leverage)."""
 
     if upper == lower:
-        return clamp(1.0 if value >= upper else 0.0)
-    if value <= lower:
-        return 0.0
-    if value >= upper:
-        return 1.0
-    normalized = (value - lower) / (upper - lower)
-    return clamp(normalized)
-
-
-def inverse_smooth_step(value: float, *, lower: float, upper: float) -> float:
-    """Inverse smooth step for ratios where lower is better (e.g., leverage)."""
-
-    if value <= lower:
-        return 1.0
-    if value >= upper:
-        return 0.0
-    normalized = 1 - (value - lower) / (upper - lower)
-    return clamp(normalized)
+        raise ValueError("inverse_smooth_step bounds must differ")
+    inv_range = 1.0 / (upper - lower)
+
+    def step(value: float) -> float:
+        return max(0.0, min(1.0, 1 - (value - lower) * inv_range))
+
+    return step
+
+
+def score_columns(
+    values: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    inverse: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """Row-wise weighted average of (inverse) smooth steps for an (n, k) metric matrix.
+
+    ``lower``/``upper``/``weights`` hold one entry per column and ``inverse`` flags the
+    columns scored like ``make_inverse_smooth_step``. Bounds must differ per column. NaN
+    metrics score 1.0, as they do through the scalar steps.
+    """
+
+    # One scratch buffer, updated in place, instead of a temporary per step.
+    steps = np.subtract(values, lower)
+    np.multiply(steps, 1.0 / (upper - lower), out=steps)
+    missing = np.isnan(steps)
+    if missing.any():
+        # Match the scalar steps, where max(0, min(1, nan)) is 1.0 for both directions:
+        # a missing inverse component is pre-set to 0.0 so the flip below yields 1.0.
+        np.copyto(steps, np.where(inverse, 0.0, 1.0), where=missing)
+    np.clip(steps, 0.0, 1.0, out=steps)
+    np.subtract(1.0, steps, out=steps, where=inverse)
+    scores = steps @ (weights / weights.sum())
+    return np.clip(scores, 0.0, 1.0, out=scores)
+
+
+# (lower, upper, inverse, weight) for one component of a factor score.
+SpecRow = Tuple[float, float, bool, float]
+
+
+class ScoreSpec:
+    """One factor's components, scored one company at a time or as a batch.
+
+    Both paths are built from the same ``SpecRow`` table, so the scalar steps and the
+    ``score_columns`` columns cannot drift apart.
+    """
+
+    __slots__ = ("_steps", "_lower", "_upper", "_inverse", "_weights")
+
+    def __init__(self, rows: Sequence[SpecRow]) -> None:
+        self._steps = tuple(
+            (weight, (make_inverse_smooth_step if inverse else make_smooth_step)(lower, upper))
+            for lower, upper, inverse, weight in rows
+        )
+        lower, upper, inverse, weights = zip(*rows)
+        self._lower = np.array(lower, dtype=np.float64)
+        self._upper = np.array(upper, dtype=np.float64)
+        self._inverse = np.array(inverse, dtype=bool)
+        self._weights = np.array(weights, dtype=np.float64)
+
+    def score(self, values: Sequence[float]) -> float:
+        """Weighted sum of the component steps for one company, clamped to 0–1."""
+
+        total = sum(weight * step(value) for (weight, step), value in zip(self._steps, values))
+        return max(0.0, min(1.0, total))
+
+    def score_batch(self, rows: Sequence[Sequence[float]]) -> np.ndarray:
+        """``score`` over many companies at once; returns one score per row."""
+
+        values = np.array(rows, dtype=np.float64).reshape(len(rows), len(self._steps))
+        return score_columns(values, self._lower, self._upper, self._inverse, self._weights)
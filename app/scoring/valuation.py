@@ -1,22 +1,40 @@
 from __future__ import annotations
 
-from .utils import weighted_average, smooth_step, inverse_smooth_step
-from app.core.metrics import ValuationMetrics, clamp
+from typing import Sequence
+
+import numpy as np
+
+from .utils import ScoreSpec
+from app.core.metrics import ValuationMetrics
+
+
+# (lower, upper, inverse, weight) per component, in ``_values`` order.
+_SPEC = ScoreSpec(
+    (
+        (0.5, 2.0, True, 0.25),  # peg_ratio
+        (-2.0, 3.0, True, 0.2),  # ev_to_ebitda_vs_peers
+        (0.0, 0.06, False, 0.2),  # free_cash_flow_yield
+        (0.0, 0.3, False, 0.2),  # price_momentum
+        (0.2, 0.8, False, 0.15),  # consolidation_score
+    )
+)
+
+
+def _values(metrics: ValuationMetrics) -> tuple[float, ...]:
+    return (
+        metrics.peg_ratio,
+        metrics.ev_to_ebitda_vs_peers,
+        metrics.free_cash_flow_yield,
+        metrics.price_momentum,
+        metrics.consolidation_score,
+    )
 
 
 def score_valuation(metrics: ValuationMetrics) -> float:
-    components = {
-        "peg": inverse_smooth_step(metrics.peg_ratio, lower=0.5, upper=2.0),
-        "ev_ebitda": inverse_smooth_step(metrics.ev_to_ebitda_vs_peers, lower=-2.0, upper=3.0),
-        "fcf_yield": smooth_step(metrics.free_cash_flow_yield, lower=0.0, upper=0.06),
-        "momentum": smooth_step(metrics.price_momentum, lower=0.0, upper=0.3),
-        "consolidation": smooth_step(metrics.consolidation_score, lower=0.2, upper=0.8),
-    }
-    weights = {
-        "peg": 0.25,
-        "ev_ebitda": 0.2,
-        "fcf_yield": 0.2,
-        "momentum": 0.2,
-        "consolidation": 0.15,
-    }
-    return clamp(weighted_average(components, weights))
+    return _SPEC.score(_values(metrics))
+
+
+def score_valuation_batch(items: Sequence[ValuationMetrics]) -> np.ndarray:
+    """Vectorized ``score_valuation`` over many companies; returns one score per item."""
+
+    return _SPEC.score_batch([_values(metrics) for metrics in items])
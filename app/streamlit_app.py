@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import io
 import sys
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-import altair as alt
 
 # Ensure the project root is importable when launching the app from the repository's
 # ``app`` directory (e.g. ``streamlit run streamlit_app.py``).
@@ -16,7 +16,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.core.backtesting import run_backtests
+from app.core.backtesting import BacktestResult, run_backtests
 from app.core.metrics import (
     CatalystMetrics,
     CompanyIndicators,
@@ -27,294 +27,77 @@ from app.core.metrics import (
     ValuationMetrics,
     WeightConfig,
 )
-from app.core.portfolio import build_portfolio_plan
+from app.core.portfolio import PortfolioPlan, build_portfolio_plan
+from app.core.prices import price_columns
 from app.core.scoring_engine import rank_companies
 from app.core.settings import UserPreferences, UserPreferencesStore, WeightSettingsStore
 from app.core.tuning import recommend_weights
 from app.data.ingestion import DataIngestionManager, build_default_manager
 from app.data.sample_data import load_sample_companies
 from app.data.sample_history import SAMPLE_PRICE_SERIES, load_fundamental_history
-from app.data.tracking import RankingTracker
+from app.data.tracking import RankingTracker, SnapshotPerformance
+from app.ui.theme import THEME_CSS, THEME_PALETTES
 
 st.set_page_config(page_title="Growth Breakout Stock Picker", layout="wide")
 
-THEME_PALETTES = {
-    "Aurora Dark": {
-        "background": "linear-gradient(135deg, #0b132b 0%, #1c2541 45%, #3a506b 100%)",
-        "container_bg": "rgba(14, 23, 43, 0.72)",
-        "card_bg": "rgba(28, 37, 65, 0.88)",
-        "accent": "#43d9ad",
-        "accent_soft": "rgba(67, 217, 173, 0.18)",
-        "text_primary": "#f5f7fa",
-        "text_secondary": "#a7b0c4",
-        "chart_colors": ["#43d9ad", "#7fffd4", "#6f9ceb", "#b892ff", "#f5a5ff"],
-    },
-    "Nimbus Light": {
-        "background": "linear-gradient(135deg, #f8fafc 0%, #eef2ff 45%, #e0f2fe 100%)",
-        "container_bg": "rgba(255, 255, 255, 0.85)",
-        "card_bg": "rgba(246, 249, 255, 0.92)",
-        "accent": "#2563eb",
-        "accent_soft": "rgba(37, 99, 235, 0.12)",
-        "text_primary": "#0f172a",
-        "text_secondary": "#475569",
-        "chart_colors": ["#2563eb", "#7dd3fc", "#a855f7", "#f472b6", "#fb923c"],
-    },
-}
-
 
 def apply_theme(theme_name: str) -> None:
-    palette = THEME_PALETTES.get(theme_name, THEME_PALETTES["Aurora Dark"])
-    st.markdown(
-        f"""
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-        body, .stApp {{
-            background: {palette['background']} !important;
-            color: {palette['text_primary']} !important;
-            font-family: 'Inter', sans-serif;
-        }}
-        .stMarkdown p, .stMarkdown li, .stMarkdown span {{
-            font-family: 'Inter', sans-serif !important;
-        }}
-        .hero-container {{
-            background: {palette['container_bg']};
-            border-radius: 24px;
-            padding: 28px 36px 32px 36px;
-            box-shadow: 0 25px 60px rgba(4, 12, 33, 0.35);
-            margin-bottom: 24px;
-        }}
-        .hero-title {{
-            font-size: 2.2rem;
-            font-weight: 700;
-            margin-bottom: 6px;
-            color: {palette['text_primary']};
-        }}
-        .hero-subtitle {{
-            font-size: 1.05rem;
-            color: {palette['text_secondary']};
-            margin-bottom: 0;
-        }}
-        .pill-badge {{
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-            padding: 6px 14px;
-            border-radius: 999px;
-            background: {palette['accent_soft']};
-            color: {palette['accent']};
-            font-size: 0.85rem;
-            margin-right: 10px;
-            font-weight: 600;
-        }}
-        .metric-card {{
-            background: {palette['card_bg']};
-            border-radius: 18px;
-            padding: 16px 18px;
-            border: 1px solid rgba(255,255,255,0.08);
-            box-shadow: 0 12px 30px rgba(3, 15, 35, 0.2);
-            min-height: 120px;
-        }}
-        .metric-card h3 {{
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: {palette['text_secondary']};
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            margin-bottom: 8px;
-        }}
-        .metric-card .metric-value {{
-            font-size: 1.8rem;
-            font-weight: 700;
-            color: {palette['text_primary']};
-        }}
-        .metric-card .metric-note {{
-            font-size: 0.85rem;
-            color: {palette['text_secondary']};
-            margin-top: 6px;
-        }}
-        .stMetric label {{
-            color: {palette['text_secondary']} !important;
-        }}
-        .stMetric div[data-testid="stMetricValue"] {{
-            color: {palette['text_primary']} !important;
-        }}
-        .stTabs [data-baseweb="tab-list"] button {{
-            background: transparent;
-            padding: 14px 22px;
-            border-radius: 14px 14px 0 0;
-            font-weight: 600;
-            color: {palette['text_secondary']};
-        }}
-        .stTabs [aria-selected="true"] {{
-            background: {palette['card_bg']};
-            color: {palette['text_primary']};
-            box-shadow: inset 0 -3px 0 {palette['accent']};
-        }}
-        [data-testid="stSidebar"] {{
-            background: transparent;
-        }}
-        .stButton button {{
-            border-radius: 14px;
-            background: {palette['accent']};
-            color: white;
-            font-weight: 600;
-            padding: 0.6rem 1.4rem;
-            box-shadow: 0 15px 30px rgba(28, 214, 155, 0.25);
-            border: none;
-        }}
-        .stButton button:hover {{
-            filter: brightness(1.05);
-        }}
-        .stDownloadButton button {{
-            border-radius: 14px;
-            border: 1px solid rgba(255,255,255,0.15);
-            color: {palette['text_primary']};
-            background: transparent;
-            font-weight: 600;
-        }}
-        .stDownloadButton button:hover {{
-            background: rgba(255,255,255,0.08);
-        }}
-        .stTextInput input,
-        .stTextArea textarea,
-        .stNumberInput input,
-        .stSelectbox div[data-baseweb="select"] > div,
-        .stSelectbox div[data-baseweb="select"] input {{
-            background: {palette['card_bg']};
-            color: {palette['text_primary']} !important;
-            border-radius: 12px;
-            border: 1px solid rgba(148, 163, 184, 0.35);
-        }}
-        .stTextInput input::placeholder,
-        .stTextArea textarea::placeholder {{
-            color: {palette['text_secondary']} !important;
-            opacity: 0.7;
-        }}
-        [data-testid="stSidebar"] label,
-        [data-testid="stSidebar"] span,
-        [data-testid="stSidebar"] p {{
-            color: {palette['text_secondary']} !important;
-        }}
-        [data-testid="stSidebar"] .stTextInput input,
-        [data-testid="stSidebar"] .stTextArea textarea,
-        [data-testid="stSidebar"] .stNumberInput input,
-        [data-testid="stSidebar"] .stSelectbox div[data-baseweb="select"] > div,
-        [data-testid="stSidebar"] .stSelectbox div[data-baseweb="select"] input {{
-            color: {palette['text_primary']} !important;
-        }}
-        .streamlit-expanderHeader {{
-            font-weight: 600;
-            color: {palette['text_primary']} !important;
-        }}
-        .streamlit-expanderContent {{
-            background: {palette['card_bg']};
-            border-radius: 0 0 16px 16px;
-            border: 1px solid rgba(255,255,255,0.05);
-        }}
-        .stDataFrame {{
-            background: {palette['card_bg']};
-            border-radius: 18px;
-            padding: 8px;
-            border: 1px solid rgba(255,255,255,0.05);
-        }}
-        .highlight-chip {{
-            display: inline-flex;
-            flex-direction: column;
-            justify-content: center;
-            gap: 2px;
-            min-width: 160px;
-            padding: 12px 16px;
-            background: {palette['card_bg']};
-            border-radius: 16px;
-            border: 1px solid {palette['accent_soft']};
-            box-shadow: 0 18px 30px rgba(15, 23, 42, 0.25);
-            margin-right: 12px;
-        }}
-        .highlight-chip span:first-child {{
-            font-size: 0.75rem;
-            color: {palette['text_secondary']};
-            text-transform: uppercase;
-            letter-spacing: 0.04em;
-        }}
-        .highlight-chip span:last-child {{
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: {palette['text_primary']};
-        }}
-        .highlight-row {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 12px;
-            margin: 6px 0 24px 0;
-        }}
-        .app-footer {{
-            margin-top: 54px;
-            padding: 18px 24px;
-            border-radius: 18px;
-            background: {palette['card_bg']};
-            border: 1px solid rgba(255,255,255,0.05);
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            flex-wrap: wrap;
-            gap: 12px;
-        }}
-        .app-footer a {{
-            color: {palette['accent']};
-            font-weight: 600;
-        }}
-        .weight-chart-container {{
-            background: {palette['card_bg']};
-            padding: 16px 18px 12px 18px;
-            border-radius: 18px;
-            border: 1px solid rgba(255,255,255,0.08);
-            box-shadow: 0 12px 28px rgba(3, 15, 35, 0.18);
-        }}
-        .altair-tooltip {{
-            font-family: 'Inter', sans-serif;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(THEME_CSS.get(theme_name, THEME_CSS["Aurora Dark"]), unsafe_allow_html=True)
 
 
-def render_hero(theme_name: str) -> None:
-    palette = THEME_PALETTES.get(theme_name, THEME_PALETTES["Aurora Dark"])
-    st.markdown(
-        f"""
-        <div class="hero-container">
-            <div class="pill-badge">🚀 Breakout intelligence · 3–5 year horizon</div>
-            <h1 class="hero-title">Growth Breakout Stock Picker</h1>
-            <p class="hero-subtitle">
-                Surface high-conviction U.S. equities that mirror the Celestica-style run: accelerating fundamentals, strategic catalysts, and balanced risk.
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+# Hero and footer markup take their colours from the theme stylesheet, so they are constants.
+_HERO_HTML = """
+<div class="hero-container">
+    <div class="pill-badge">🚀 Breakout intelligence · 3–5 year horizon</div>
+    <h1 class="hero-title">Growth Breakout Stock Picker</h1>
+    <p class="hero-subtitle">
+        Surface high-conviction U.S. equities that mirror the Celestica-style run: accelerating fundamentals, strategic catalysts, and balanced risk.
+    </p>
+</div>
+"""
 
+_FOOTER_HTML = """
+<div class="app-footer">
+    <span>⚡️ Continue refining your playbook — refresh data frequently to capture regime shifts.</span>
+    <span><a href="https://www.investopedia.com/terms/b/bottomsupanalysis.asp" target="_blank">Explore bottom-up research primer ↗</a></span>
+</div>
+"""
+
+
+def render_hero() -> None:
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
+
+
+def render_footer() -> None:
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+
+
+def _format_timestamp(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%b %d %H:%M")
 
-def render_footer(theme_name: str) -> None:
-    palette = THEME_PALETTES.get(theme_name, THEME_PALETTES["Aurora Dark"])
-    st.markdown(
-        f"""
-        <div class="app-footer">
-            <span>⚡️ Continue refining your playbook — refresh data frequently to capture regime shifts.</span>
-            <span><a href="https://www.investopedia.com/terms/b/bottomsupanalysis.asp" target="_blank">Explore bottom-up research primer ↗</a></span>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+
+def _format_weights(weights: WeightConfig) -> str:
+    return ", ".join(f"{factor}: {weight:.0%}" for factor, weight in weights.to_dict().items())
 
 
 def _persist_preferences() -> None:
+    theme = st.session_state.get("theme_choice", "Aurora Dark")
+    favorites = st.session_state.get("favorite_tickers", [])
+    live_tickers = st.session_state.get("live_tickers", [])
+    data_mode = st.session_state.get("data_mode", "Live data (cached)")
+    auto_refresh = st.session_state.get("auto_refresh", False)
+    # Most reruns change none of these, so skip building and comparing the dataclass.
+    fingerprint = (theme, tuple(favorites), tuple(live_tickers), data_mode, auto_refresh)
+    if st.session_state.get("_pref_fingerprint") == fingerprint:
+        return
+    st.session_state["_pref_fingerprint"] = fingerprint
+
     current = UserPreferences(
-        theme=st.session_state.get("theme_choice", "Aurora Dark"),
-        favorites=st.session_state.get("favorite_tickers", []),
-        live_tickers=st.session_state.get("live_tickers", []),
-        data_mode=st.session_state.get("data_mode", "Live data (cached)"),
-        auto_refresh=st.session_state.get("auto_refresh", False),
+        theme=theme,
+        favorites=favorites,
+        live_tickers=live_tickers,
+        data_mode=data_mode,
+        auto_refresh=auto_refresh,
     )
     stored: UserPreferences = st.session_state.get("preferences", UserPreferences())
     if current != stored:
@@ -332,6 +115,81 @@ def _get_tracker() -> RankingTracker:
     return RankingTracker()
 
 
+# The quarter axis is anchored on today, so entries expire hourly; max_entries bounds RAM.
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=64)
+def _cached_fundamentals(ticker: str) -> pd.DataFrame:
+    return load_fundamental_history(ticker)
+
+
+# History only grows by appending, so its length and newest timestamp identify it; the
+# TTL lets refreshed cached closes show up without a new snapshot.
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+def _cached_performance(
+    history_key: Tuple[int, str], _tracker: RankingTracker, _manager: DataIngestionManager
+) -> List[SnapshotPerformance]:
+    return _tracker.build_performance(_manager)
+
+
+# The donut only changes with the weights or the theme, so reruns reuse the finished spec.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _weight_chart_spec(weights: Tuple[Tuple[str, float], ...], theme_name: str) -> Dict[str, object]:
+    # Deferred: altair is the heaviest import in the app and only this chart needs it.
+    import altair as alt
+
+    palette = THEME_PALETTES.get(theme_name, THEME_PALETTES["Aurora Dark"])
+    weight_df = pd.DataFrame({"Factor": [factor for factor, _ in weights], "Weight": [weight for _, weight in weights]})
+    color_scale = alt.Scale(range=palette["chart_colors"])
+    chart = (
+        alt.Chart(weight_df)
+        .mark_arc(innerRadius=60, stroke="white")
+        .encode(
+            theta=alt.Theta(field="Weight", type="quantitative"),
+            color=alt.Color(field="Factor", type="nominal", scale=color_scale),
+            tooltip=["Factor", alt.Tooltip("Weight", format=".0%")],
+        )
+    )
+    return chart.to_dict()
+
+
+def _series_signature(payload: Dict[str, object]) -> tuple:
+    """Content key for one series: length, date range and a hash of every close.
+
+    Backtests read every close (drawdown spans the whole series), and split or dividend
+    adjustments rewrite earlier closes in place, so the endpoints alone are not enough.
+    """
+
+    try:
+        dates, closes = price_columns(payload)
+    except (KeyError, TypeError):
+        return (None,)
+    if len(closes) and len(dates):
+        return (len(closes), dates[0], dates[-1], hash(tuple(closes)))
+    return (len(closes),)
+
+
+def _price_fingerprint(price_payloads: Dict[str, Dict[str, object]]) -> Tuple[tuple, ...]:
+    return tuple((ticker, *_series_signature(payload)) for ticker, payload in sorted(price_payloads.items()))
+
+
+# The date parse dominates for long live histories; the signature invalidates on new data.
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_close_series(ticker: str, signature: tuple, _payload: Dict[str, object]) -> pd.Series:
+    dates, closes = price_columns(_payload)
+    return pd.Series(
+        np.fromiter(closes, dtype=np.float64, count=len(closes)),
+        index=pd.to_datetime(dates),
+        name="close",
+    )
+
+
+# Keyed on the fingerprint only; the leading underscore keeps the payloads out of the hash.
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_backtests(
+    fingerprint: Tuple[tuple, ...], _price_payloads: Dict[str, Dict[str, object]]
+) -> List[BacktestResult]:
+    return run_backtests(_price_payloads)
+
+
 weight_store = WeightSettingsStore()
 preferences_store = UserPreferencesStore()
 
@@ -352,36 +210,27 @@ st.session_state.setdefault("auto_refresh", preferences.auto_refresh)
 st.session_state.setdefault("data_mode", preferences.data_mode)
 
 apply_theme(st.session_state["theme_choice"])
-render_hero(st.session_state["theme_choice"])
+render_hero()
 
 
 manager = _get_manager()
 
 
-def _render_scorecards(
-    scores: List[ScoreBreakdown],
-    theme_name: str,
-    favorites: List[str],
-    price_payloads: Dict[str, Dict[str, object]],
-) -> None:
-    weight_mapping = (scores[0].weights or WeightConfig()).normalized().to_dict() if scores else {}
-    ranking_df = pd.DataFrame([score.to_dict() for score in scores])
+_SCORE_COLUMNS = ("ticker", "name", "composite", "growth", "quality", "catalysts", "valuation", "risk")
+_score_row = attrgetter(*_SCORE_COLUMNS)
+
+
+def _build_ranking_frame(
+    scores: List[ScoreBreakdown], favorites: List[str]
+) -> Tuple[pd.DataFrame, List[Dict[str, object]]]:
+    # Read the columns straight off the dataclasses rather than via a to_dict() per score.
+    ranking_df = pd.DataFrame.from_records([_score_row(score) for score in scores], columns=_SCORE_COLUMNS)
     highlight_records: List[Dict[str, object]] = []
     if not ranking_df.empty:
-        favorite_set = {ticker.upper() for ticker in favorites}
-        ranking_df = ranking_df[
-            [
-                "ticker",
-                "name",
-                "composite",
-                "growth",
-                "quality",
-                "catalysts",
-                "valuation",
-                "risk",
-            ]
-        ].copy()
-        ranking_df["is_favorite"] = ranking_df["ticker"].str.upper().isin(favorite_set)
+        favorite_set = frozenset(ticker.upper() for ticker in favorites)
+        ranking_df["is_favorite"] = np.fromiter(
+            (score.ticker.upper() in favorite_set for score in scores), dtype=bool, count=len(scores)
+        )
         highlight_records = [
             {
                 "ticker": row.ticker,
@@ -404,6 +253,15 @@ def _render_scorecards(
             }
         )
 
+    return ranking_df, highlight_records
+
+
+# A fragment, so the "Inspect ticker" selectbox reruns only this section; every other
+# widget still reruns the whole script.
+@st.fragment
+def _render_scorecards(scores: List[ScoreBreakdown], theme_name: str, favorites: List[str]) -> None:
+    ranking_df, highlight_records = _build_ranking_frame(scores, favorites)
+
     st.subheader("Ranked Candidates")
     if ranking_df.empty:
         st.info("No companies to display yet. Configure a data source to begin.")
@@ -433,75 +291,61 @@ def _render_scorecards(
         )
 
     top_row = ranking_df.iloc[0]
-    col1, col2, col3 = st.columns(3)
-    col1.markdown(
-        f"""
-        <div class="metric-card">
-            <h3>Top composite</h3>
-            <div class="metric-value">{top_row['Composite']:.3f}</div>
-            <div class="metric-note">{top_row['Ticker']} · {top_row['Name']}</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-    col2.markdown(
-        f"""
-        <div class="metric-card">
-            <h3>Average growth score</h3>
-            <div class="metric-value">{ranking_df['Growth'].mean():.3f}</div>
-            <div class="metric-note">Blend of revenue, backlog, and margin acceleration</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-    col3.markdown(
+    # One flex row instead of three column containers each carrying its own markdown element.
+    st.markdown(
         f"""
-        <div class="metric-card">
-            <h3>Risk guardrail</h3>
-            <div class="metric-value">{ranking_df['Risk'].mean():.3f}</div>
-            <div class="metric-note">Lower is safer · Liquidity & drawdown filters</div>
+        <div class="metric-row">
+            <div class="metric-card">
+                <h3>Top composite</h3>
+                <div class="metric-value">{top_row['Composite']:.3f}</div>
+                <div class="metric-note">{top_row['Ticker']} · {top_row['Name']}</div>
+            </div>
+            <div class="metric-card">
+                <h3>Average growth score</h3>
+                <div class="metric-value">{ranking_df['Growth'].mean():.3f}</div>
+                <div class="metric-note">Blend of revenue, backlog, and margin acceleration</div>
+            </div>
+            <div class="metric-card">
+                <h3>Risk guardrail</h3>
+                <div class="metric-value">{ranking_df['Risk'].mean():.3f}</div>
+                <div class="metric-note">Lower is safer · Liquidity & drawdown filters</div>
+            </div>
         </div>
         """,
         unsafe_allow_html=True,
     )
 
-    styled_df = (
-        ranking_df.assign(**{"★": ranking_df["★"].map({True: "★", False: ""})})
-        .style.format(
-            {
-                "Composite": "{:.3f}",
-                "Growth": "{:.3f}",
-                "Quality": "{:.3f}",
-                "Catalysts": "{:.3f}",
-                "Valuation": "{:.3f}",
-                "Risk": "{:.3f}",
-            }
-        )
-        .background_gradient(cmap="viridis", subset=["Composite"])
-        .set_properties(**{"font-weight": "600"}, subset=["Composite"])
+    # column_config formats client-side; a Styler would build per-cell CSS in Python.
+    st.dataframe(
+        ranking_df.assign(**{"★": ranking_df["★"].map({True: "★", False: ""})}),
+        use_container_width=True,
+        column_config={
+            "Composite": st.column_config.ProgressColumn(format="%.3f", min_value=0.0, max_value=1.0),
+            "Growth": st.column_config.NumberColumn(format="%.3f"),
+            "Quality": st.column_config.NumberColumn(format="%.3f"),
+            "Catalysts": st.column_config.NumberColumn(format="%.3f"),
+            "Valuation": st.column_config.NumberColumn(format="%.3f"),
+            "Risk": st.column_config.NumberColumn(format="%.3f"),
+        },
     )
 
-    st.dataframe(styled_df, use_container_width=True)
-
     st.markdown(
         f"<span style='font-weight:600;color:{palette['accent']}'>Active weights</span> — "
-        + ", ".join(f"{factor}: {weight_mapping[factor]:.0%}" for factor in weight_mapping),
+        + _format_weights(scores[0].weights or WeightConfig()),
         unsafe_allow_html=True,
     )
 
-    tracker = _get_tracker()
-    if st.button("Record snapshot", icon="🗂️"):
-        tracker.append(scores, price_lookup=price_payloads)
-        st.success("Snapshot saved for historical tracking.")
-
-    for score in scores:
-        with st.expander(f"{score.ticker} — {score.name}"):
-            st.markdown(
-                f"**Composite:** {score.composite:.3f}\\  "
-                f"Growth {score.growth:.3f} • Quality {score.quality:.3f} • "
-                f"Catalysts {score.catalysts:.3f} • Valuation {score.valuation:.3f} • "
-                f"Risk {score.risk:.3f}"
-            )
+    # One breakdown on demand instead of a disclosure per score.
+    scores_by_ticker = {score.ticker: score for score in scores}
+    picked = st.selectbox("Inspect ticker", list(scores_by_ticker), key="scorecard_inspect")
+    score = scores_by_ticker[picked]
+    st.markdown(
+        f"**{score.ticker} — {score.name}**  \n"
+        f"**Composite:** {score.composite:.3f}\\  "
+        f"Growth {score.growth:.3f} • Quality {score.quality:.3f} • "
+        f"Catalysts {score.catalysts:.3f} • Valuation {score.valuation:.3f} • "
+        f"Risk {score.risk:.3f}"
+    )
 
 
 def _render_factor_drilldown(
@@ -524,7 +368,7 @@ def _render_factor_drilldown(
     left, right = st.columns(2)
     with left:
         try:
-            fundamentals_df = load_fundamental_history(ticker)
+            fundamentals_df = _cached_fundamentals(ticker)
             st.line_chart(fundamentals_df[["revenue"]], height=260)
             st.line_chart(fundamentals_df[["ebit_margin"]], height=260)
         except Exception:
@@ -533,11 +377,9 @@ def _render_factor_drilldown(
     with right:
         payload = price_payloads.get(ticker)
         if payload:
-            df = pd.DataFrame(payload.get("candles", []))
-            if not df.empty:
-                df["date"] = pd.to_datetime(df["date"])
-                df = df.set_index("date")
-                st.line_chart(df[["close"]], height=320)
+            signature = _series_signature(payload)
+            if signature[0]:
+                st.line_chart(_cached_close_series(ticker, signature, payload), height=320)
             else:
                 st.info("Price history not available in the selected data source.")
         else:
@@ -552,16 +394,16 @@ def _render_backtests(results) -> None:
         st.warning("No valid price history was available for backtesting.")
         return
 
+    count = len(results)
     df = pd.DataFrame(
-        [
-            {
-                "Ticker": result.ticker,
-                "Cumulative Return": result.cumulative_return,
-                "CAGR": result.cagr,
-                "Max Drawdown": result.max_drawdown,
-            }
-            for result in results
-        ]
+        {
+            "Ticker": [result.ticker for result in results],
+            "Cumulative Return": np.fromiter(
+                (result.cumulative_return for result in results), dtype=np.float64, count=count
+            ),
+            "CAGR": np.fromiter((result.cagr for result in results), dtype=np.float64, count=count),
+            "Max Drawdown": np.fromiter((result.max_drawdown for result in results), dtype=np.float64, count=count),
+        }
     )
     st.dataframe(
         df,
@@ -574,69 +416,124 @@ def _render_backtests(results) -> None:
     )
 
 
+def _portfolio_frames(plan: PortfolioPlan) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    suggestions = plan.suggestions
+    suggestions_df = pd.DataFrame(
+        {
+            "Ticker": [suggestion.ticker for suggestion in suggestions],
+            "Name": [suggestion.name for suggestion in suggestions],
+            "Weight": np.fromiter(
+                (suggestion.weight for suggestion in suggestions), dtype=np.float64, count=len(suggestions)
+            ),
+            "Composite": np.fromiter(
+                (suggestion.composite for suggestion in suggestions), dtype=np.float64, count=len(suggestions)
+            ),
+            "Notes": [", ".join(suggestion.notes) if suggestion.notes else "" for suggestion in suggestions],
+        }
+    )
+    sector_df = pd.DataFrame(
+        {
+            "Sector": list(plan.sector_allocations.keys()),
+            "Weight": list(plan.sector_allocations.values()),
+        }
+    )
+    scenario_df = pd.DataFrame(
+        {
+            "Scenario": [scenario.name for scenario in plan.scenarios],
+            "Expected": [scenario.expected_return for scenario in plan.scenarios],
+            "Volatility": [scenario.volatility for scenario in plan.scenarios],
+            "5% VaR": [scenario.value_at_risk for scenario in plan.scenarios],
+            "Notes": ["; ".join(scenario.notes) for scenario in plan.scenarios],
+        }
+    )
+    return suggestions_df, sector_df, scenario_df
+
+
 def _render_portfolio(scores: List[ScoreBreakdown], indicator_map: Dict[str, CompanyIndicators]) -> None:
     plan = build_portfolio_plan(scores, indicator_map)
     if not plan.suggestions:
         st.info("Compute rankings to generate a draft portfolio plan.")
         return
 
-    df = pd.DataFrame(
-        {
-            "Ticker": suggestion.ticker,
-            "Name": suggestion.name,
-            "Weight": suggestion.weight,
-            "Composite": suggestion.composite,
-            "Notes": ", ".join(suggestion.notes) if suggestion.notes else "",
-        }
-        for suggestion in plan.suggestions
-    )
-    st.dataframe(
-        df,
-        use_container_width=True,
-        column_config={
-            "Weight": st.column_config.NumberColumn(format="%.1%"),
-            "Composite": st.column_config.NumberColumn(format="%.3f"),
-        },
-    )
     st.markdown(
         f"**Expected return proxy:** {plan.expected_return:.1%}  •  "
         f"Volatility proxy: {plan.volatility_proxy:.2f}  •  "
         f"Diversification index: {plan.diversification_index:.2f}"
     )
-    if plan.sector_allocations:
-        sector_df = pd.DataFrame(
-            {
-                "Sector": list(plan.sector_allocations.keys()),
-                "Weight": list(plan.sector_allocations.values()),
-            }
-        )
-        st.markdown("#### Sector exposures")
-        st.dataframe(
-            sector_df,
-            use_container_width=True,
-            column_config={"Weight": st.column_config.NumberColumn(format="%.1%")},
-        )
-
-    if plan.scenarios:
-        scenario_df = pd.DataFrame(
-            {
-                "Scenario": [scenario.name for scenario in plan.scenarios],
-                "Expected": [scenario.expected_return for scenario in plan.scenarios],
-                "Volatility": [scenario.volatility for scenario in plan.scenarios],
-                "5% VaR": [scenario.value_at_risk for scenario in plan.scenarios],
-                "Notes": ["; ".join(scenario.notes) for scenario in plan.scenarios],
-            }
-        )
-        st.markdown("#### Stress scenarios")
+    suggestions_df, sector_df, scenario_df = _portfolio_frames(plan)
+    tab_suggestions, tab_sectors, tab_scenarios = st.tabs(["Suggestions", "Sector exposures", "Stress scenarios"])
+    with tab_suggestions:
         st.dataframe(
-            scenario_df,
+            suggestions_df,
             use_container_width=True,
             column_config={
-                "Expected": st.column_config.NumberColumn(format="%.1%"),
-                "Volatility": st.column_config.NumberColumn(format="%.1%"),
-                "5% VaR": st.column_config.NumberColumn(format="%.1%"),
+                "Weight": st.column_config.NumberColumn(format="%.1%"),
+                "Composite": st.column_config.NumberColumn(format="%.3f"),
             },
         )
+    with tab_sectors:
+        if sector_df.empty:
+            st.info("No sector data available for the current plan.")
+        else:
+            st.dataframe(
+                sector_df,
+                use_container_width=True,
+                column_config={"Weight": st.column_config.NumberColumn(format="%.1%")},
+            )
+    with tab_scenarios:
+        if scenario_df.empty:
+            st.info("No stress scenarios available for the current plan.")
+        else:
+            st.dataframe(
+                scenario_df,
+                use_container_width=True,
+                column_config={
+                    "Expected": st.column_config.NumberColumn(format="%.1%"),
+                    "Volatility": st.column_config.NumberColumn(format="%.1%"),
+                    "5% VaR": st.column_config.NumberColumn(format="%.1%"),
+                },
+            )
+
+
+_TEMPLATE_COLUMNS = {
+    "ticker": "CLS",
+    "name": "Celestica Inc.",
+    "revenue_cagr_3y": 0.17,
+    "revenue_acceleration": 0.05,
+    "ebit_margin_trend": 0.04,
+    "fcf_margin": 0.08,
+    "backlog_growth": 0.32,
+    "roic": 0.19,
+    "roic_trend": 0.05,
+    "net_debt_to_ebitda": 1.1,
+    "interest_coverage": 10.0,
+    "asset_turnover_trend": 0.08,
+    "theme_alignment": 0.85,
+    "earnings_revision_trend": 0.18,
+    "insider_activity_score": 0.55,
+    "strategic_investor_presence": 0.3,
+    "peg_ratio": 0.9,
+    "ev_to_ebitda_vs_peers": -1.5,
+    "free_cash_flow_yield": 0.05,
+    "price_momentum": 0.22,
+    "consolidation_score": 0.6,
+    "market_cap": 4.2e9,
+    "avg_daily_dollar_volume": 4.5e7,
+    "beta": 1.1,
+    "volatility_3y": 0.32,
+    "drawdown_1y": 0.2,
+}
+_TEMPLATE_KEYS = frozenset(_TEMPLATE_COLUMNS)
+_NUMERIC_COLUMNS = tuple(col for col in _TEMPLATE_COLUMNS if col not in ("ticker", "name"))
+_NUMERIC_INDEX = {name: index for index, name in enumerate(_NUMERIC_COLUMNS)}
+
+
+# Streamlit re-executes this script on every rerun, so module-level work here is not
+# "once at import"; the resource cache serialises the template once per process, and
+# only when the upload tab is actually shown.
+@st.cache_resource(show_spinner=False)
+def _template_csv_bytes() -> bytes:
+    return pd.DataFrame([_TEMPLATE_COLUMNS]).to_csv(index=False).encode("utf-8")
 
 
 def _manual_csv_upload() -> List[CompanyIndicators]:
@@ -646,39 +543,9 @@ def _manual_csv_upload() -> List[CompanyIndicators]:
         "A ready-to-edit template is provided below."
     )
 
-    template_buffer = io.StringIO()
-    template_columns = {
-        "ticker": "CLS",
-        "name": "Celestica Inc.",
-        "revenue_cagr_3y": 0.17,
-        "revenue_acceleration": 0.05,
-        "ebit_margin_trend": 0.04,
-        "fcf_margin": 0.08,
-        "backlog_growth": 0.32,
-        "roic": 0.19,
-        "roic_trend": 0.05,
-        "net_debt_to_ebitda": 1.1,
-        "interest_coverage": 10.0,
-        "asset_turnover_trend": 0.08,
-        "theme_alignment": 0.85,
-        "earnings_revision_trend": 0.18,
-        "insider_activity_score": 0.55,
-        "strategic_investor_presence": 0.3,
-        "peg_ratio": 0.9,
-        "ev_to_ebitda_vs_peers": -1.5,
-        "free_cash_flow_yield": 0.05,
-        "price_momentum": 0.22,
-        "consolidation_score": 0.6,
-        "market_cap": 4.2e9,
-        "avg_daily_dollar_volume": 4.5e7,
-        "beta": 1.1,
-        "volatility_3y": 0.32,
-        "drawdown_1y": 0.2,
-    }
-    pd.DataFrame([template_columns]).to_csv(template_buffer, index=False)
     st.download_button(
         "Download CSV template",
-        template_buffer.getvalue().encode("utf-8"),
+        _template_csv_bytes(),
         file_name="indicator_template.csv",
         mime="text/csv",
     )
@@ -689,56 +556,66 @@ def _manual_csv_upload() -> List[CompanyIndicators]:
         return []
 
     df = pd.read_csv(uploaded_file)
-    missing_columns = [col for col in template_columns if col not in df.columns]
-    if missing_columns:
+    if not _TEMPLATE_KEYS.issubset(df.columns):
+        # Listed in template order so the message matches the downloadable template.
+        missing_columns = [col for col in _TEMPLATE_COLUMNS if col not in df.columns]
         st.error(
             "The following columns are missing from the uploaded CSV: " + ", ".join(missing_columns)
         )
         return []
 
+    # Convert the metric columns once instead of boxing every cell through iterrows().
+    values = df[list(_NUMERIC_COLUMNS)].to_numpy(dtype=np.float64)
+    col = _NUMERIC_INDEX
+    strategic_missing = np.isnan(values[:, col["strategic_investor_presence"]])
+    tickers = df["ticker"].astype(str).str.upper()
+    names = df["name"].fillna("").astype(str)
+    names = names.where(names.str.len() > 0, tickers)
+
     indicators: List[CompanyIndicators] = []
-    for _, row in df.iterrows():
+    for i, (ticker, name) in enumerate(zip(tickers.tolist(), names.tolist())):
+        row = values[i].tolist()
         growth = GrowthMetrics(
-            revenue_cagr_3y=float(row["revenue_cagr_3y"]),
-            revenue_acceleration=float(row["revenue_acceleration"]),
-            ebit_margin_trend=float(row["ebit_margin_trend"]),
-            fcf_margin=float(row["fcf_margin"]),
-            backlog_growth=float(row["backlog_growth"]),
+            revenue_cagr_3y=row[col["revenue_cagr_3y"]],
+            revenue_acceleration=row[col["revenue_acceleration"]],
+            ebit_margin_trend=row[col["ebit_margin_trend"]],
+            fcf_margin=row[col["fcf_margin"]],
+            backlog_growth=row[col["backlog_growth"]],
         )
         quality = QualityMetrics(
-            roic=float(row["roic"]),
-            roic_trend=float(row["roic_trend"]),
-            net_debt_to_ebitda=float(row["net_debt_to_ebitda"]),
-            interest_coverage=float(row["interest_coverage"]),
-            asset_turnover_trend=float(row["asset_turnover_trend"]),
+            roic=row[col["roic"]],
+            roic_trend=row[col["roic_trend"]],
+            net_debt_to_ebitda=row[col["net_debt_to_ebitda"]],
+            interest_coverage=row[col["interest_coverage"]],
+            asset_turnover_trend=row[col["asset_turnover_trend"]],
         )
         catalysts = CatalystMetrics(
-            theme_alignment=float(row["theme_alignment"]),
-            earnings_revision_trend=float(row["earnings_revision_trend"]),
-            insider_activity_score=float(row["insider_activity_score"]),
-            strategic_investor_presence=float(row["strategic_investor_presence"])
-            if not pd.isna(row["strategic_investor_presence"])
-            else None,
+            theme_alignment=row[col["theme_alignment"]],
+            earnings_revision_trend=row[col["earnings_revision_trend"]],
+            insider_activity_score=row[col["insider_activity_score"]],
+            strategic_investor_presence=None
+            if strategic_missing[i]
+            else row[col["strategic_investor_presence"]],
         )
         valuation = ValuationMetrics(
-            peg_ratio=float(row["peg_ratio"]),
-            ev_to_ebitda_vs_peers=float(row["ev_to_ebitda_vs_peers"]),
-            free_cash_flow_yield=float(row["free_cash_flow_yield"]),
-            price_momentum=float(row["price_momentum"]),
-            consolidation_score=float(row["consolidation_score"]),
+            peg_ratio=row[col["peg_ratio"]],
+            ev_to_ebitda_vs_peers=row[col["ev_to_ebitda_vs_peers"]],
+            free_cash_flow_yield=row[col["free_cash_flow_yield"]],
+            price_momentum=row[col["price_momentum"]],
+            consolidation_score=row[col["consolidation_score"]],
         )
         risk = RiskMetrics(
-            market_cap=float(row["market_cap"]),
-            avg_daily_dollar_volume=float(row["avg_daily_dollar_volume"]),
-            beta=float(row["beta"]),
-            volatility_3y=float(row["volatility_3y"]),
-            drawdown_1y=float(row["drawdown_1y"]),
+            market_cap=row[col["market_cap"]],
+            avg_daily_dollar_volume=row[col["avg_daily_dollar_volume"]],
+            beta=row[col["beta"]],
+            volatility_3y=row[col["volatility_3y"]],
+            drawdown_1y=row[col["drawdown_1y"]],
         )
 
         indicators.append(
             CompanyIndicators(
-                ticker=str(row["ticker"]).upper(),
-                name=str(row.get("name", "")) or str(row["ticker"]).upper(),
+                ticker=ticker,
+                name=name,
                 growth=growth,
                 quality=quality,
                 catalysts=catalysts,
@@ -826,21 +703,16 @@ with st.sidebar:
 
     st.markdown("---")
     st.header("Data health")
+    health_lines = []
     for status in manager.get_provider_health():
-        last_success = (
-            datetime.fromtimestamp(status.last_success_at).strftime("%b %d %H:%M")
-            if status.last_success_at
-            else "never"
-        )
+        last_success = _format_timestamp(status.last_success_at) if status.last_success_at else "never"
         health_msg = f"✅ Last success {last_success}"
         if status.last_error:
-            last_error = (
-                datetime.fromtimestamp(status.last_error_at).strftime("%b %d %H:%M")
-                if status.last_error_at
-                else ""
-            )
+            last_error = _format_timestamp(status.last_error_at) if status.last_error_at else ""
             health_msg = f"⚠️ {status.last_error} ({last_error})"
-        st.caption(f"**{status.name}** — {health_msg}")
+        health_lines.append(f"**{status.name}** — {health_msg}")
+    # One caption for all providers instead of a frontend element per provider.
+    st.caption("\n\n".join(health_lines))
 
 
 indicator_map: Dict[str, CompanyIndicators] = {}
@@ -850,7 +722,8 @@ indicators: List[CompanyIndicators] = []
 if mode == "Sample data":
     indicators = load_sample_companies()
     indicator_map = {item.ticker: item for item in indicators}
-    price_payloads = {ticker: {"candles": candles} for ticker, candles in SAMPLE_PRICE_SERIES.items()}
+    # Shared module constant; nothing downstream mutates the payload mapping.
+    price_payloads = SAMPLE_PRICE_SERIES
 elif mode == "Live data (cached)":
     tickers_input = st.sidebar.text_input(
         "Tickers", value=", ".join(st.session_state.get("live_tickers", ["CLS", "NVST", "SMCI"]))
@@ -866,11 +739,10 @@ elif mode == "Live data (cached)":
                 f"Auto-refreshed: {', '.join(auto_summary.refreshed)}", icon="🔄"
             )
     if tickers:
-        for ticker in tickers:
-            try:
-                result = manager.get_company(ticker, force_refresh=refresh)
-            except Exception as exc:  # noqa: BLE001
-                st.error(f"Failed to fetch {ticker}: {exc}")
+        # Tickers are fetched concurrently; failures come back per ticker.
+        for ticker, result in manager.get_companies(tickers, force_refresh=refresh):
+            if isinstance(result, Exception):
+                st.error(f"Failed to fetch {ticker}: {result}")
                 continue
             indicators.append(result.indicators)
             indicator_map[result.ticker] = result.indicators
@@ -885,12 +757,19 @@ else:
 _persist_preferences()
 
 
+# Normalised once per rerun and shared by the ranking and the weight chart.
+active_weights: WeightConfig = st.session_state["weight_config"]
+normalized_weights = active_weights.normalized()
+
 scores: List[ScoreBreakdown] = []
-if indicators and st.session_state["weight_config"].total_weight() > 0:
-    scores = rank_companies(indicators, weight_config=st.session_state["weight_config"].normalized())
+if indicators and active_weights.total_weight() > 0:
+    # Ranking is one vectorised pass, far cheaper than hashing the indicators for a cache key.
+    scores = rank_companies(indicators, weight_config=normalized_weights)
 
 
-backtest_results = run_backtests(price_payloads) if price_payloads else None
+backtest_results = (
+    _cached_backtests(_price_fingerprint(price_payloads), price_payloads) if price_payloads else None
+)
 
 
 tab_rank, tab_drilldown, tab_backtest, tab_portfolio, tab_history = st.tabs(
@@ -904,33 +783,18 @@ tab_rank, tab_drilldown, tab_backtest, tab_portfolio, tab_history = st.tabs(
 )
 
 with tab_rank:
-    _render_scorecards(
-        scores,
-        st.session_state["theme_choice"],
-        st.session_state.get("favorite_tickers", []),
-        price_payloads,
-    )
+    _render_scorecards(scores, st.session_state["theme_choice"], st.session_state.get("favorite_tickers", []))
+    # Outside the fragment: recording has to refresh the history tab, so one full rerun
+    # does it instead of a fragment run followed by st.rerun(scope="app").
+    if scores and st.button("Record snapshot", icon="🗂️"):
+        _get_tracker().append(scores, price_lookup=price_payloads)
+        st.success("Snapshot saved for historical tracking.")
     if scores:
         with st.container():
             st.markdown("### Weight distribution")
-            palette = THEME_PALETTES.get(st.session_state["theme_choice"], THEME_PALETTES["Aurora Dark"])
-            weights = st.session_state["weight_config"].normalized().to_dict()
-            weight_df = pd.DataFrame(
-                {"Factor": list(weights.keys()), "Weight": list(weights.values())}
-            )
-            if not weight_df.empty:
-                color_scale = alt.Scale(range=palette["chart_colors"])
-                chart = (
-                    alt.Chart(weight_df)
-                    .mark_arc(innerRadius=60, stroke="white")
-                    .encode(
-                        theta=alt.Theta(field="Weight", type="quantitative"),
-                        color=alt.Color(field="Factor", type="nominal", scale=color_scale),
-                        tooltip=["Factor", alt.Tooltip("Weight", format=".0%")],
-                    )
-                )
+            spec = _weight_chart_spec(tuple(normalized_weights.to_dict().items()), st.session_state["theme_choice"])
         st.markdown("<div class='weight-chart-container'>", unsafe_allow_html=True)
-        st.altair_chart(chart, use_container_width=True)
+        st.vega_lite_chart(spec, use_container_width=True)
         st.markdown("</div>", unsafe_allow_html=True)
     else:
         st.info("Adjust weights to visualize distribution.")
@@ -965,21 +829,30 @@ with tab_history:
     if not history:
         st.info("Record at least one snapshot to view historical rankings.")
     else:
-        performances = tracker.build_performance(manager)
+        performances = _cached_performance((len(history), history[-1].created_at), tracker, manager)
         if not performances:
             st.warning("Snapshots exist but no price history is available to score performance yet.")
         else:
+            target_hits = np.fromiter(
+                (item.target_met for item in performances), dtype=bool, count=len(performances)
+            )
+            # Column-wise construction; the price columns are nullable, so None becomes NaN.
             df = pd.DataFrame(
                 {
-                    "Run": item.run_timestamp,
-                    "Ticker": item.ticker,
-                    "Composite": item.composite,
-                    "Recorded price": item.recorded_price,
-                    "Latest price": item.latest_price,
-                    "Return since snapshot": item.return_since_capture,
-                    "Target met": "🎯" if item.target_met else "",
+                    "Run": [item.run_timestamp for item in performances],
+                    "Ticker": [item.ticker for item in performances],
+                    "Composite": np.fromiter(
+                        (item.composite for item in performances), dtype=np.float64, count=len(performances)
+                    ),
+                    "Recorded price": np.array(
+                        [item.recorded_price for item in performances], dtype=np.float64
+                    ),
+                    "Latest price": np.array([item.latest_price for item in performances], dtype=np.float64),
+                    "Return since snapshot": np.array(
+                        [item.return_since_capture for item in performances], dtype=np.float64
+                    ),
+                    "Target met": ["🎯" if hit else "" for hit in target_hits.tolist()],
                 }
-                for item in performances
             )
             st.dataframe(
                 df,
@@ -993,10 +866,11 @@ with tab_history:
             )
 
             summary = (
-                df.assign(hit=df["Target met"] == "🎯")
-                .groupby("Run")
+                # Snapshots are stored chronologically, so the runs are already in order.
+                df.assign(hit=target_hits)
+                .groupby("Run", sort=False)
                 .agg(
-                    ideas=("Ticker", "count"),
+                    ideas=("Ticker", "size"),
                     avg_return=("Return since snapshot", "mean"),
                     hit_rate=("hit", "mean"),
                 )
@@ -1014,4 +888,4 @@ with tab_history:
                 },
             )
 
-render_footer(st.session_state["theme_choice"])
+render_footer()
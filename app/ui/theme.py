@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from typing import Dict
+
+
+THEME_PALETTES = {
+    "Aurora Dark": {
+        "background": "linear-gradient(135deg, #0b132b 0%, #1c2541 45%, #3a506b 100%)",
+        "container_bg": "rgba(14, 23, 43, 0.72)",
+        "card_bg": "rgba(28, 37, 65, 0.88)",
+        "accent": "#43d9ad",
+        "accent_soft": "rgba(67, 217, 173, 0.18)",
+        "text_primary": "#f5f7fa",
+        "text_secondary": "#a7b0c4",
+        "chart_colors": ["#43d9ad", "#7fffd4", "#6f9ceb", "#b892ff", "#f5a5ff"],
+    },
+    "Nimbus Light": {
+        "background": "linear-gradient(135deg, #f8fafc 0%, #eef2ff 45%, #e0f2fe 100%)",
+        "container_bg": "rgba(255, 255, 255, 0.85)",
+        "card_bg": "rgba(246, 249, 255, 0.92)",
+        "accent": "#2563eb",
+        "accent_soft": "rgba(37, 99, 235, 0.12)",
+        "text_primary": "#0f172a",
+        "text_secondary": "#475569",
+        "chart_colors": ["#2563eb", "#7dd3fc", "#a855f7", "#f472b6", "#fb923c"],
+    },
+}
+
+
+def _format_css(palette: Dict[str, object]) -> str:
+    return f"""
+        <style>
+        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+        body, .stApp {{
+            background: {palette['background']} !important;
+            color: {palette['text_primary']} !important;
+            font-family: 'Inter', sans-serif;
+        }}
+        .stMarkdown p, .stMarkdown li, .stMarkdown span {{
+            font-family: 'Inter', sans-serif !important;
+        }}
+        .hero-container {{
+            background: {palette['container_bg']};
+            border-radius: 24px;
+            padding: 28px 36px 32px 36px;
+            box-shadow: 0 25px 60px rgba(4, 12, 33, 0.35);
+            margin-bottom: 24px;
+        }}
+        .hero-title {{
+            font-size: 2.2rem;
+            font-weight: 700;
+            margin-bottom: 6px;
+            color: {palette['text_primary']};
+        }}
+        .hero-subtitle {{
+            font-size: 1.05rem;
+            color: {palette['text_secondary']};
+            margin-bottom: 0;
+        }}
+        .pill-badge {{
+            display: inline-flex;
+            align-items: center;
+            gap: 6px;
+            padding: 6px 14px;
+            border-radius: 999px;
+            background: {palette['accent_soft']};
+            color: {palette['accent']};
+            font-size: 0.85rem;
+            margin-right: 10px;
+            font-weight: 600;
+        }}
+        .metric-row {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 16px;
+            margin-bottom: 16px;
+        }}
+        .metric-row .metric-card {{
+            flex: 1 1 220px;
+        }}
+        .metric-card {{
+            background: {palette['card_bg']};
+            border-radius: 18px;
+            padding: 16px 18px;
+            border: 1px solid rgba(255,255,255,0.08);
+            box-shadow: 0 12px 30px rgba(3, 15, 35, 0.2);
+            min-height: 120px;
+        }}
+        .metric-card h3 {{
+            font-size: 0.9rem;
+            font-weight: 600;
+            color: {palette['text_secondary']};
+            text-transform: uppercase;
+            letter-spacing: 0.05em;
+            margin-bottom: 8px;
+        }}
+        .metric-card .metric-value {{
+            font-size: 1.8rem;
+            font-weight: 700;
+            color: {palette['text_primary']};
+        }}
+        .metric-card .metric-note {{
+            font-size: 0.85rem;
+            color: {palette['text_secondary']};
+            margin-top: 6px;
+        }}
+        .stMetric label {{
+            color: {palette['text_secondary']} !important;
+        }}
+        .stMetric div[data-testid="stMetricValue"] {{
+            color: {palette['text_primary']} !important;
+        }}
+        .stTabs [data-baseweb="tab-list"] button {{
+            background: transparent;
+            padding: 14px 22px;
+            border-radius: 14px 14px 0 0;
+            font-weight: 600;
+            color: {palette['text_secondary']};
+        }}
+        .stTabs [aria-selected="true"] {{
+            background: {palette['card_bg']};
+            color: {palette['text_primary']};
+            box-shadow: inset 0 -3px 0 {palette['accent']};
+        }}
+        [data-testid="stSidebar"] {{
+            background: transparent;
+        }}
+        .stButton button {{
+            border-radius: 14px;
+            background: {palette['accent']};
+            color: white;
+            font-weight: 600;
+            padding: 0.6rem 1.4rem;
+            box-shadow: 0 15px 30px rgba(28, 214, 155, 0.25);
+            border: none;
+        }}
+        .stButton button:hover {{
+            filter: brightness(1.05);
+        }}
+        .stDownloadButton button {{
+            border-radius: 14px;
+            border: 1px solid rgba(255,255,255,0.15);
+            color: {palette['text_primary']};
+            background: transparent;
+            font-weight: 600;
+        }}
+        .stDownloadButton button:hover {{
+            background: rgba(255,255,255,0.08);
+        }}
+        .stTextInput input,
+        .stTextArea textarea,
+        .stNumberInput input,
+        .stSelectbox div[data-baseweb="select"] > div,
+        .stSelectbox div[data-baseweb="select"] input {{
+            background: {palette['card_bg']};
+            color: {palette['text_primary']} !important;
+            border-radius: 12px;
+            border: 1px solid rgba(148, 163, 184, 0.35);
+        }}
+        .stTextInput input::placeholder,
+        .stTextArea textarea::placeholder {{
+            color: {palette['text_secondary']} !important;
+            opacity: 0.7;
+        }}
+        [data-testid="stSidebar"] label,
+        [data-testid="stSidebar"] span,
+        [data-testid="stSidebar"] p {{
+            color: {palette['text_secondary']} !important;
+        }}
+        [data-testid="stSidebar"] .stTextInput input,
+        [data-testid="stSidebar"] .stTextArea textarea,
+        [data-testid="stSidebar"] .stNumberInput input,
+        [data-testid="stSidebar"] .stSelectbox div[data-baseweb="select"] > div,
+        [data-testid="stSidebar"] .stSelectbox div[data-baseweb="select"] input {{
+            color: {palette['text_primary']} !important;
+        }}
+        .streamlit-expanderHeader {{
+            font-weight: 600;
+            color: {palette['text_primary']} !important;
+        }}
+        .streamlit-expanderContent {{
+            background: {palette['card_bg']};
+            border-radius: 0 0 16px 16px;
+            border: 1px solid rgba(255,255,255,0.05);
+        }}
+        .stDataFrame {{
+            background: {palette['card_bg']};
+            border-radius: 18px;
+            padding: 8px;
+            border: 1px solid rgba(255,255,255,0.05);
+        }}
+        .highlight-chip {{
+            display: inline-flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 2px;
+            min-width: 160px;
+            padding: 12px 16px;
+            background: {palette['card_bg']};
+            border-radius: 16px;
+            border: 1px solid {palette['accent_soft']};
+            box-shadow: 0 18px 30px rgba(15, 23, 42, 0.25);
+            margin-right: 12px;
+        }}
+        .highlight-chip span:first-child {{
+            font-size: 0.75rem;
+            color: {palette['text_secondary']};
+            text-transform: uppercase;
+            letter-spacing: 0.04em;
+        }}
+        .highlight-chip span:last-child {{
+            font-size: 1.1rem;
+            font-weight: 600;
+            color: {palette['text_primary']};
+        }}
+        .highlight-row {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 12px;
+            margin: 6px 0 24px 0;
+        }}
+        .app-footer {{
+            margin-top: 54px;
+            padding: 18px 24px;
+            border-radius: 18px;
+            background: {palette['card_bg']};
+            border: 1px solid rgba(255,255,255,0.05);
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+            flex-wrap: wrap;
+            gap: 12px;
+        }}
+        .app-footer a {{
+            color: {palette['accent']};
+            font-weight: 600;
+        }}
+        .weight-chart-container {{
+            background: {palette['card_bg']};
+            padding: 16px 18px 12px 18px;
+            border-radius: 18px;
+            border: 1px solid rgba(255,255,255,0.08);
+            box-shadow: 0 12px 28px rgba(3, 15, 35, 0.18);
+        }}
+        .altair-tooltip {{
+            font-family: 'Inter', sans-serif;
+        }}
+        </style>
+        """
+
+
+# Streamlit re-executes the app script on every rerun but imports this module once, so
+# each stylesheet is formatted a single time per process.
+THEME_CSS: Dict[str, str] = {name: _format_css(palette) for name, palette in THEME_PALETTES.items()}
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import copy
+import math
+import unittest
+from dataclasses import fields
+
+from app.core.portfolio import build_portfolio_plan
+from app.core.scoring_engine import evaluate_company, rank_companies
+from app.data.sample_data import load_sample_companies
+from app.scoring.catalysts import score_catalysts, score_catalysts_batch
+from app.scoring.growth import score_growth, score_growth_batch
+from app.scoring.quality import score_quality, score_quality_batch
+from app.scoring.risk import score_risk, score_risk_batch
+from app.scoring.valuation import score_valuation, score_valuation_batch
+
+_SCORERS = {
+    "growth": (score_growth, score_growth_batch),
+    "quality": (score_quality, score_quality_batch),
+    "catalysts": (score_catalysts, score_catalysts_batch),
+    "valuation": (score_valuation, score_valuation_batch),
+    "risk": (score_risk, score_risk_batch),
+}
+
+
+def _variants(metrics: object) -> list:
+    """The metrics as given plus one copy per field set to NaN, +/-inf and (if optional) None."""
+
+    variants = [metrics]
+    for item in fields(metrics):
+        replacements = [math.nan, math.inf, -math.inf]
+        if "Optional" in str(item.type):
+            replacements.append(None)
+        for value in replacements:
+            variant = copy.copy(metrics)
+            setattr(variant, item.name, value)
+            variants.append(variant)
+    return variants
+
+
+class BatchScalarParityTest(unittest.TestCase):
+    def test_batch_matches_scalar_including_missing_values(self) -> None:
+        companies = load_sample_companies()
+        for factor, (scalar, batch) in _SCORERS.items():
+            items = [variant for company in companies for variant in _variants(getattr(company, factor))]
+            batch_scores = batch(items).tolist()
+            for item, batch_score in zip(items, batch_scores):
+                with self.subTest(factor=factor, metrics=item):
+                    self.assertAlmostEqual(batch_score, scalar(item), places=12)
+
+    def test_nan_metric_does_not_poison_ranking_or_plan(self) -> None:
+        companies = load_sample_companies()
+        index = next(i for i, company in enumerate(companies) if company.ticker == "CLS")
+        target = copy.copy(companies[index])
+        target.growth = copy.copy(target.growth)
+        target.growth.fcf_margin = math.nan
+        companies[index] = target
+
+        ranked = rank_companies(companies)
+        by_ticker = {score.ticker: score for score in ranked}
+        expected = evaluate_company(target)
+        self.assertAlmostEqual(by_ticker["CLS"].composite, expected.composite, places=12)
+        self.assertTrue(all(math.isfinite(score.composite) for score in ranked))
+
+        plan = build_portfolio_plan(ranked, {company.ticker: company for company in companies})
+        self.assertTrue(all(math.isfinite(suggestion.weight) for suggestion in plan.suggestions))
+        self.assertTrue(math.isfinite(plan.expected_return))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.core.scoring_engine import rank_companies
+from app.data.sample_data import load_sample_companies
+from app.data.tracking import RankingTracker
+
+
+class LegacyHistoryMigrationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.path = self.root / "rankings.jsonl"
+        self.legacy = self.root / "rankings.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_array_file_is_converted_once(self) -> None:
+        self.legacy.write_text(
+            json.dumps(
+                [
+                    {"created_at": "2024-01-01T00:00:00", "scores": [{"ticker": "CLS", "composite": 0.5}]},
+                    {"created_at": "2024-02-01T00:00:00", "entries": [{"ticker": "VRT", "composite": 0.4}]},
+                ]
+            )
+        )
+
+        tracker = RankingTracker(self.path)
+
+        self.assertFalse(self.legacy.exists())
+        self.assertTrue((self.root / "rankings.json.bak").exists())
+        lines = self.path.read_bytes().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["entries"][0]["ticker"], "CLS")
+
+        tracker.append(rank_companies(load_sample_companies())[:1])
+        history = RankingTracker(self.path).load_history()
+        self.assertEqual([snapshot.created_at[:10] for snapshot in history[:2]], ["2024-01-01", "2024-02-01"])
+        self.assertEqual(len(history), 3)
+
+    def test_json_lines_in_legacy_name_are_carried_over(self) -> None:
+        self.legacy.write_text('{"created_at": "2024-03-01T00:00:00", "entries": []}\n')
+
+        history = RankingTracker(self.path).load_history()
+
+        self.assertEqual([snapshot.created_at for snapshot in history], ["2024-03-01T00:00:00"])
+
+    def test_explicit_path_holding_an_array_is_converted_in_place(self) -> None:
+        path = self.root / "hist.json"
+        path.write_text(json.dumps([{"created_at": "2024-05-01T00:00:00", "entries": []}], indent=2))
+
+        tracker = RankingTracker(path)
+        tracker.append(rank_companies(load_sample_companies())[:1])
+
+        history = RankingTracker(path).load_history()
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[0].created_at, "2024-05-01T00:00:00")
+        self.assertTrue((self.root / "hist.json.bak").exists())
+
+    def test_existing_history_is_left_alone(self) -> None:
+        self.path.write_text('{"created_at": "2024-04-01T00:00:00", "entries": []}\n')
+        self.legacy.write_text("[]")
+
+        history = RankingTracker(self.path).load_history()
+
+        self.assertEqual(len(history), 1)
+        self.assertTrue(self.legacy.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
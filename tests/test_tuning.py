@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import math
+import unittest
+
+import pandas as pd
+
+from app.core.backtesting import BacktestResult
+from app.core.metrics import ScoreBreakdown
+from app.core.tuning import recommend_weights
+
+_FACTORS = ("growth", "quality", "catalysts", "valuation", "risk")
+_ROWS = {
+    "AAA": (0.9, 0.4, 0.7, 0.2, 0.5, 0.30),
+    "BBB": (0.6, math.nan, 0.5, 0.4, 0.6, 0.12),
+    "CCC": (0.3, 0.8, 0.2, 0.7, 0.4, -0.05),
+    "DDD": (0.7, 0.5, 0.9, 0.1, 0.3, math.nan),
+    "EEE": (0.5, 0.6, 0.4, 0.5, 0.8, 0.08),
+}
+
+
+class RecommendWeightsTest(unittest.TestCase):
+    def test_missing_values_are_skipped_pairwise_like_pandas(self) -> None:
+        scores = [ScoreBreakdown(ticker, ticker, *row[:5]) for ticker, row in _ROWS.items()]
+        backtests = [
+            BacktestResult(ticker=ticker, cumulative_return=0.0, cagr=row[5], max_drawdown=0.0)
+            for ticker, row in _ROWS.items()
+        ]
+
+        result = recommend_weights(scores, backtests)
+
+        frame = pd.DataFrame.from_dict(_ROWS, orient="index", columns=[*_FACTORS, "cagr"])
+        self.assertIsNotNone(result)
+        for factor in _FACTORS:
+            with self.subTest(factor=factor):
+                expected = frame[factor].corr(frame["cagr"])
+                self.assertAlmostEqual(result.factor_correlations[factor], expected, places=12)
+        self.assertTrue(all(math.isfinite(value) for value in result.recommended.to_dict().values()))
+
+
+if __name__ == "__main__":
+    unittest.main()